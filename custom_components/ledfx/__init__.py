@@ -16,15 +16,20 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_WEBSOCKET,
     DEFAULT_CALL_DELAY,
+    DEFAULT_MAX_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLEEP,
     DEFAULT_TIMEOUT,
     DOMAIN,
     OPTION_IS_FROM_FLOW,
     PLATFORMS,
+    STORAGE_VERSION,
     UPDATE_LISTENER,
     UPDATER,
 )
@@ -57,6 +62,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ),
         get_config_value(entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         get_config_value(entry, CONF_TIMEOUT, DEFAULT_TIMEOUT),
+        entry_id=entry.entry_id,
+        is_websocket=get_config_value(entry, CONF_WEBSOCKET, False),
+        max_scan_interval=get_config_value(
+            entry, CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        ),
     )
 
     hass.data.setdefault(DOMAIN, {})
@@ -83,6 +93,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if is_new:
         await async_start()
         await asyncio.sleep(DEFAULT_SLEEP)
+    elif await _updater.async_restore():
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+        hass.loop.call_later(
+            DEFAULT_CALL_DELAY,
+            lambda: hass.async_create_task(_updater.async_refresh()),
+        )
     else:
         hass.loop.call_later(
             DEFAULT_CALL_DELAY,
@@ -132,3 +149,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return is_unload
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the snapshot of a deleted entry.
+
+    :param hass: HomeAssistant: Home Assistant object
+    :param entry: ConfigEntry: Config Entry object
+    """
+
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import ATTR_STATE, SIGNAL_NEW_BUTTON
+from .const import SIGNAL_NEW_BUTTON
 from .entity import LedFxEntity
 from .enum import ActionType
 from .updater import LedFxEntityDescription, LedFxUpdater, async_get_updater
@@ -82,13 +82,15 @@ class LedFxButton(LedFxEntity, ButtonEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
         self._attr_device_info = entity.device_info
         self._type = entity.type
 
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
-        is_available: bool = self._updater.data.get(ATTR_STATE, False)
+        is_available: bool = self._updater.is_available(self._attr_source)
 
         if self._attr_available == is_available:  # type: ignore
             return
@@ -102,6 +104,8 @@ class LedFxButton(LedFxEntity, ButtonEntity):
 
         await self._updater.client.run_scene(self.entity_description.key)
 
+        self._updater.async_mark_active()
+
     async def async_press(self) -> None:
         """Async press action."""
 
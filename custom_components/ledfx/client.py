@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -11,25 +17,82 @@ from httpx import (
     USE_CLIENT_DEFAULT,
     AsyncClient,
     ConnectError,
+    ConnectTimeout,
     HTTPError,
+    NetworkError,
+    RemoteProtocolError,
     Response,
+    Timeout,
     TransportError,
 )
 
 from .const import (
+    CLIENT_GET_TIMEOUTS,
     CLIENT_URL,
+    CLIENT_WRITE_TIMEOUTS,
+    DEFAULT_CIRCUIT_FAILURES,
+    DEFAULT_CIRCUIT_HISTORY,
+    DEFAULT_CIRCUIT_RESET_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_POOL_TIMEOUT,
     DEFAULT_POST_TIMEOUT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
     DEFAULT_TIMEOUT,
     DIAGNOSTIC_CONTENT,
     DIAGNOSTIC_DATE_TIME,
+    DIAGNOSTIC_FAILURES,
     DIAGNOSTIC_MESSAGE,
+    DIAGNOSTIC_STATE,
+    DIAGNOSTIC_TRANSITIONS,
+    STATISTIC_COALESCED_REQUESTS,
+    STATISTIC_CONNECTIONS_NEW,
+    STATISTIC_CONNECTIONS_REUSED,
+    STATISTIC_UNCHANGED_RESPONSES,
 )
-from .enum import Method
-from .exceptions import LedFxConnectionError, LedFxRequestError
+from .enum import CircuitState, Method, RequestPriority
+from .exceptions import LedFxConnectionError, LedFxNotModified, LedFxRequestError
+from .scheduler import LedFxRequestScheduler
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def json_dumps(data: Any) -> bytes:
+    """Encode request body with the stdlib json module.
+
+    :param data: Any: Body
+    :return bytes: Encoded body
+    """
+
+    return json.dumps(data).encode()
+
+
+# orjson is several times faster on the large schema and config payloads,
+# the stdlib json module is used when it is not installed.
+# pylint: disable=no-member
+JSON_LOADS: Callable[[bytes | str], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
+JSON_DUMPS: Callable[[Any], bytes] = orjson.dumps if orjson is not None else json_dumps
+# pylint: enable=no-member
+
+# Read and pool timeouts are not retried, retrying a slow server only adds
+# load and outlasts the refresh deadline.
+RETRY_ERRORS: tuple[type[TransportError], ...] = (
+    ConnectTimeout,
+    NetworkError,
+    RemoteProtocolError,
+)
+
+
 # pylint: disable=too-many-public-methods,too-many-arguments
 class LedFxClient:
     """LedFx API Client."""
@@ -40,6 +103,7 @@ class LedFxClient:
     _client: AsyncClient
     _auth: Any = USE_CLIENT_DEFAULT
     _timeout: int = DEFAULT_TIMEOUT
+    _retries: int = DEFAULT_RETRIES
 
     _url: str
 
@@ -50,6 +114,12 @@ class LedFxClient:
         port: str,
         auth: Any = USE_CLIENT_DEFAULT,
         timeout: int = DEFAULT_TIMEOUT,
+        loads: Callable[[bytes | str], Any] | None = None,
+        dumps: Callable[[Any], bytes] | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
+        retries: int = DEFAULT_RETRIES,
     ) -> None:
         """Initialize API client.
 
@@ -58,6 +128,12 @@ class LedFxClient:
         :param port: str: port
         :param auth: Union[Tuple, USE_CLIENT_DEFAULT]: auth data
         :param timeout: int: Query execution timeout
+        :param loads: Callable[[bytes | str], Any] | None: Response decoder
+        :param dumps: Callable[[Any], bytes] | None: Request body encoder
+        :param max_concurrent_requests: int: Requests in flight limit
+        :param rate_limit: float | None: Requests per second, None to disable
+        :param rate_burst: int: Requests allowed in a burst
+        :param retries: int: Retries of GET requests on connection errors
         """
 
         ip = ip.removesuffix("/")
@@ -66,10 +142,37 @@ class LedFxClient:
         self.port = port
         self._auth = auth
         self._timeout = timeout
+        self._retries = retries
+        self._loads = loads or JSON_LOADS
+        self._dumps = dumps or JSON_DUMPS
 
         self._url = CLIENT_URL.format(ip=ip, port=port)
 
-        self.diagnostics: dict[str, Any] = {}
+        self.statistics: dict[str, int] = {
+            STATISTIC_CONNECTIONS_NEW: 0,
+            STATISTIC_CONNECTIONS_REUSED: 0,
+            STATISTIC_UNCHANGED_RESPONSES: 0,
+            STATISTIC_COALESCED_REQUESTS: 0,
+        }
+
+        self._hashes: dict[str, str] = {}
+        self._received_hashes: dict[str, str] = {}
+        self._diagnostics: dict[str, tuple[datetime, str, Any]] = {}
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+        self.retries: dict[str, int] = {}
+
+        self.scheduler: LedFxRequestScheduler = LedFxRequestScheduler(
+            max_concurrent_requests, rate_limit, rate_burst
+        )
+
+        self.circuit: CircuitState = CircuitState.CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probe: asyncio.Future | None = None
+        self._transitions: deque[tuple[datetime, CircuitState]] = deque(
+            maxlen=DEFAULT_CIRCUIT_HISTORY
+        )
 
     async def request(
         self,
@@ -77,32 +180,135 @@ class LedFxClient:
         method: Method = Method.GET,
         body: dict | None = None,
         validate_field: str | tuple = "status",
+        with_hash: bool = False,
+        skip_unchanged: bool = False,
+        priority: RequestPriority | None = None,
     ) -> dict:
         """Request method.
 
+        Concurrent identical GET requests share one in-flight request,
+        all callers get the same decoded result or exception. The request
+        is cancelled when its last caller is cancelled.
+        Requests fail fast while the circuit breaker is open.
+        Writes are interactive and served before any poll by default.
+
         :param path: str: api path
         :param method: Method: api method
         :param body: dict | None: api body
         :param validate_field: str | tuple: validate field
+        :param with_hash: bool: Remember the content hash of the response
+        :param skip_unchanged: bool: Raise LedFxNotModified when the content
+            matches the committed hash
+        :param priority: RequestPriority | None: Scheduling priority
         :return dict: dict with api data.
         """
 
-        _timeout: int = (
-            self._timeout
-            if method == Method.GET
-            else max(self._timeout, DEFAULT_POST_TIMEOUT)
+        await self._async_check_circuit()
+
+        if priority is None:
+            priority = (
+                RequestPriority.STATE
+                if method == Method.GET
+                else RequestPriority.INTERACTIVE
+            )
+
+        if method != Method.GET:
+            return await self._request(
+                path, method, body, validate_field, with_hash, skip_unchanged, priority
+            )
+
+        key: tuple = (path, validate_field, with_hash, skip_unchanged)
+
+        if key in self._in_flight:
+            self.statistics[STATISTIC_COALESCED_REQUESTS] += 1
+
+            return await self._async_wait(self._in_flight[key])
+
+        future: asyncio.Future = asyncio.ensure_future(
+            self._request(
+                path, method, body, validate_field, with_hash, skip_unchanged, priority
+            )
         )
+
+        def done(_future: asyncio.Future) -> None:
+            """Forget finished request.
+
+            :param _future: asyncio.Future
+            """
+
+            self._in_flight.pop(key, None)
+
+            if not _future.cancelled():
+                _future.exception()
+
+        future.add_done_callback(done)
+        self._in_flight[key] = future
+
+        return await self._async_wait(future)
+
+    async def _async_wait(self, future: asyncio.Future) -> dict:
+        """Wait for a shared request, cancel it with its last caller.
+
+        :param future: asyncio.Future: Shared request
+        :return dict: dict with api data.
+        """
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[future] -= 1
+
+            if not self._waiters[future]:
+                del self._waiters[future]
+
+                if not future.done():
+                    future.cancel()
+
+    async def _request(
+        self,
+        path: str,
+        method: Method,
+        body: dict | None,
+        validate_field: str | tuple,
+        with_hash: bool,
+        skip_unchanged: bool,
+        priority: RequestPriority,
+    ) -> dict:
+        """Perform request.
+
+        :param path: str: api path
+        :param method: Method: api method
+        :param body: dict | None: api body
+        :param validate_field: str | tuple: validate field
+        :param with_hash: bool: Remember the content hash of the response
+        :param skip_unchanged: bool: Raise LedFxNotModified on unchanged content
+        :param priority: RequestPriority: Scheduling priority
+        :return dict: dict with api data.
+        """
+
         _url: str = f"{self._url}/{path}"
 
         try:
-            async with self._client as client:
-                response: Response = await client.request(
-                    method.value, _url, json=body, timeout=_timeout, auth=self._auth
-                )
+            response: Response = await self._async_send(path, method, body, priority)
 
-            self._debug("Successful request", _url, response.content, path)
+            self._circuit_success()
+
+            _hash: str | None = (
+                hashlib.blake2b(response.content, digest_size=16).hexdigest()
+                if with_hash
+                else None
+            )
 
-            _data: dict = json.loads(response.content)
+            if skip_unchanged and _hash == self._hashes.get(path):
+                self.statistics[STATISTIC_UNCHANGED_RESPONSES] += 1
+
+                raise LedFxNotModified("Response not modified")
+
+            _data: dict = self._loads(response.content)
+
+            self._debug("Successful request", _url, response.content, path)
         except (
             HTTPError,
             ConnectError,
@@ -113,6 +319,9 @@ class LedFxClient:
         ) as _e:  # pragma: no cover
             self._debug("Connection error", _url, _e, path)
 
+            if isinstance(_e, HTTPError):
+                self._circuit_failure()
+
             raise LedFxConnectionError("Connection error") from _e
 
         if validate_field == "status" and (
@@ -130,15 +339,204 @@ class LedFxClient:
 
             raise LedFxRequestError("Request error")
 
+        if _hash is not None:
+            self._received_hashes[path] = _hash
+
         return _data
 
+    async def _async_send(
+        self,
+        path: str,
+        method: Method,
+        body: dict | None,
+        priority: RequestPriority,
+    ) -> Response:
+        """Send request, GET requests are retried on connection errors.
+
+        Retries wait a random time up to an exponentially growing backoff.
+
+        :param path: str: api path
+        :param method: Method: api method
+        :param body: dict | None: api body
+        :param priority: RequestPriority: Scheduling priority
+        :return Response: Response
+        """
+
+        _url: str = f"{self._url}/{path}"
+        _timeout: Timeout = self._build_timeout(path, method)
+        attempt: int = 0
+
+        connection: dict[str, bool] = {"is_new": False}
+
+        async def trace(event: str, info: dict) -> None:
+            """Connection pool trace
+
+            :param event: str: Event name
+            :param info: dict: Event info
+            """
+
+            if event == "connection.connect_tcp.complete":
+                connection["is_new"] = True
+
+        while True:
+            try:
+                async with self.scheduler.slot(priority):
+                    response: Response = await self._client.request(
+                        method.value,
+                        _url,
+                        content=self._dumps(body) if body is not None else None,
+                        headers={"Content-Type": "application/json"}
+                        if body is not None
+                        else None,
+                        timeout=_timeout,
+                        auth=self._auth,
+                        extensions={"trace": trace},
+                    )
+
+                break
+            except RETRY_ERRORS as _e:
+                if method != Method.GET or attempt >= self._retries:
+                    raise
+
+                attempt += 1
+                self.retries[path] = self.retries.get(path, 0) + 1
+
+                _LOGGER.debug("Retry %s (%s): %r", attempt, _url, _e)
+
+                await asyncio.sleep(
+                    random.uniform(0, DEFAULT_RETRY_BACKOFF * 2**attempt)
+                )
+
+        self.statistics[
+            STATISTIC_CONNECTIONS_NEW
+            if connection["is_new"]
+            else STATISTIC_CONNECTIONS_REUSED
+        ] += 1
+
+        return response
+
+    def _build_timeout(self, path: str, method: Method) -> Timeout:
+        """Build connect, read and pool timeouts of a request.
+
+        :param path: str: api path
+        :param method: Method: api method
+        :return Timeout: Request timeout
+        """
+
+        timeouts: dict[str, float] = (
+            CLIENT_GET_TIMEOUTS if method == Method.GET else CLIENT_WRITE_TIMEOUTS
+        )
+        read: float = timeouts.get(
+            path,
+            timeouts.get(
+                path.rsplit("/", 1)[-1],
+                self._timeout
+                if method == Method.GET
+                else max(self._timeout, DEFAULT_POST_TIMEOUT),
+            ),
+        )
+
+        return Timeout(read, connect=DEFAULT_CONNECT_TIMEOUT, pool=DEFAULT_POOL_TIMEOUT)
+
+    async def _async_check_circuit(self) -> None:
+        """Fail fast while the circuit breaker is open.
+
+        After the reset timeout a single probe decides whether the breaker
+        closes, concurrent requests wait for its result.
+        """
+
+        if self.circuit == CircuitState.CLOSED:
+            return
+
+        if self.circuit == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < DEFAULT_CIRCUIT_RESET_TIMEOUT:
+                raise LedFxConnectionError("Circuit breaker is open")
+
+            self._set_circuit(CircuitState.HALF_OPEN)
+            self._probe = asyncio.ensure_future(self._async_probe())
+
+        if self._probe is None or not await asyncio.shield(self._probe):
+            raise LedFxConnectionError("Circuit breaker is open")
+
+    async def _async_probe(self) -> bool:
+        """Probe LedFx with a lightweight request.
+
+        Any HTTP response means the host is reachable again.
+
+        :return bool: Is the breaker closed
+        """
+
+        _url: str = f"{self._url}/info"
+
+        try:
+            await self._client.request(
+                Method.GET.value,
+                _url,
+                timeout=self._build_timeout("info", Method.GET),
+                auth=self._auth,
+            )
+        except HTTPError as _e:
+            self._debug("Circuit probe failed", _url, _e, "info")
+
+            self._open_circuit()
+
+            return False
+
+        self._circuit_success()
+
+        return True
+
+    def _circuit_success(self) -> None:
+        """Close the circuit breaker after a response."""
+
+        self._failures = 0
+
+        if self.circuit != CircuitState.CLOSED:
+            self._set_circuit(CircuitState.CLOSED)
+
+    def _circuit_failure(self) -> None:
+        """Open the circuit breaker after too many connection failures."""
+
+        self._failures += 1
+
+        if (
+            self.circuit == CircuitState.CLOSED
+            and self._failures >= DEFAULT_CIRCUIT_FAILURES
+        ):
+            self._open_circuit()
+
+    def _open_circuit(self) -> None:
+        """Open the circuit breaker."""
+
+        self._opened_at = time.monotonic()
+        self._set_circuit(CircuitState.OPEN)
+
+    def _set_circuit(self, state: CircuitState) -> None:
+        """Change the circuit breaker state.
+
+        :param state: CircuitState: New state
+        """
+
+        _LOGGER.info(
+            "LedFx %s:%s circuit breaker %s -> %s",
+            self.ip,
+            self.port,
+            self.circuit.value,
+            state.value,
+        )
+
+        self.circuit = state
+        self._transitions.append((datetime.now(), state))
+
     async def info(self) -> dict:
         """info method.
 
         :return dict: dict with api data.
         """
 
-        return await self.request("info", validate_field="url")
+        return await self.request(
+            "info", validate_field="url", priority=RequestPriority.CATALOG
+        )
 
     async def devices(self) -> dict:
         """devices method.
@@ -156,13 +554,22 @@ class LedFxClient:
 
         return await self.request("virtuals")
 
+    async def virtual(self, device_code: str) -> dict:
+        """virtuals single device method.
+
+        :param device_code: str: device code
+        :return dict: dict with api data.
+        """
+
+        return await self.request(f"virtuals/{device_code}", validate_field=device_code)
+
     async def scenes(self) -> dict:
         """scenes method.
 
         :return dict: dict with api data.
         """
 
-        return await self.request("scenes")
+        return await self.request("scenes", priority=RequestPriority.CATALOG)
 
     async def audio_devices(self) -> dict:
         """audio/devices method.
@@ -170,42 +577,68 @@ class LedFxClient:
         :return dict: dict with api data.
         """
 
-        return await self.request("audio/devices", validate_field="devices")
+        return await self.request(
+            "audio/devices", validate_field="devices", priority=RequestPriority.CATALOG
+        )
 
-    async def schema(self) -> dict:
+    async def schema(self, skip_unchanged: bool = False) -> dict:
         """schema method.
 
+        :param skip_unchanged: bool: Raise LedFxNotModified on unchanged content
         :return dict: dict with api data.
         """
 
-        return await self.request("schema", validate_field="devices")
+        return await self.request(
+            "schema",
+            validate_field="devices",
+            with_hash=True,
+            skip_unchanged=skip_unchanged,
+            priority=RequestPriority.CATALOG,
+        )
 
-    async def config(self) -> dict:
+    async def config(self, skip_unchanged: bool = False) -> dict:
         """config method.
 
+        :param skip_unchanged: bool: Raise LedFxNotModified on unchanged content
         :return dict: dict with api data.
         """
 
         return await self.request(
-            "config", validate_field=("config", "configuration_version")
+            "config",
+            validate_field=("config", "configuration_version"),
+            with_hash=True,
+            skip_unchanged=skip_unchanged,
+            priority=RequestPriority.CATALOG,
         )
 
-    async def colors(self) -> dict:
+    async def colors(self, skip_unchanged: bool = False) -> dict:
         """colors method.
 
+        :param skip_unchanged: bool: Raise LedFxNotModified on unchanged content
         :return dict: dict with api data.
         """
 
-        return await self.request("colors", validate_field="colors")
+        return await self.request(
+            "colors",
+            validate_field="colors",
+            with_hash=True,
+            skip_unchanged=skip_unchanged,
+            priority=RequestPriority.CATALOG,
+        )
 
     async def device_on(
-        self, device_code: str, effect: str, is_virtual: bool = False
+        self,
+        device_code: str,
+        effect: str,
+        is_virtual: bool = False,
+        config: dict | None = None,
     ) -> dict:
         """devices/effects on method.
 
         :param device_code: str: device code
         :param effect: str: effect code
         :param is_virtual: bool: Is virtual device
+        :param config: dict | None: effect config applied with the effect
         :return dict: dict with api data.
         """
 
@@ -214,7 +647,7 @@ class LedFxClient:
         return await self.request(
             f"{prefix}/{device_code}/effects",
             Method.POST,
-            {"config": {"active": True}, "type": effect},
+            {"config": {"active": True} | (config or {}), "type": effect},
         )
 
     async def device_off(self, device_code: str, is_virtual: bool = False) -> dict:
@@ -301,6 +734,76 @@ class LedFxClient:
             "scenes", Method.PUT, {"action": "activate", "id": scene_id}
         )
 
+    def content_hash(self, path: str) -> str | None:
+        """Content hash of the last response of a path requested with a hash.
+
+        :param path: str: Request path
+        :return str | None: Content hash
+        """
+
+        return self._received_hashes.get(path)
+
+    def commit_hash(self, path: str, content_hash: str | None) -> None:
+        """Commit the content hash of a path once its response is applied.
+
+        Only committed hashes let later requests skip unchanged content, so
+        a response that was received but never applied is parsed again.
+
+        :param path: str: Request path
+        :param content_hash: str | None: Content hash, None to forget it
+        """
+
+        if content_hash is None:
+            self._hashes.pop(path, None)
+        else:
+            self._hashes[path] = content_hash
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Diagnostics of the last request per path.
+
+        Captured content is decoded only here, outside of the request path.
+
+        :return dict[str, Any]: Diagnostics data
+        """
+
+        diagnostics: dict[str, Any] = {}
+
+        for path, (date_time, message, content) in self._diagnostics.items():
+            _content: dict | str = {}
+
+            try:
+                _content = self._loads(content)
+            except (ValueError, TypeError):  # pragma: no cover
+                _content = str(content)
+
+            diagnostics[path] = {
+                DIAGNOSTIC_DATE_TIME: date_time.replace(microsecond=0).isoformat(),
+                DIAGNOSTIC_MESSAGE: message,
+                DIAGNOSTIC_CONTENT: _content,
+            }
+
+        return diagnostics
+
+    @property
+    def circuit_diagnostics(self) -> dict[str, Any]:
+        """Circuit breaker state and its last transitions.
+
+        :return dict[str, Any]: Diagnostics data
+        """
+
+        return {
+            DIAGNOSTIC_STATE: self.circuit.value,
+            DIAGNOSTIC_FAILURES: self._failures,
+            DIAGNOSTIC_TRANSITIONS: [
+                {
+                    DIAGNOSTIC_DATE_TIME: date_time.replace(microsecond=0).isoformat(),
+                    DIAGNOSTIC_STATE: state.value,
+                }
+                for date_time, state in self._transitions
+            ],
+        }
+
     def _debug(self, message: str, url: str, content: Any, path: str) -> None:
         """Debug log
 
@@ -310,17 +813,6 @@ class LedFxClient:
         :param path: str: Path
         """
 
-        _LOGGER.debug("%s (%s): %s", message, url, str(content))
-
-        _content: dict | str = {}
+        _LOGGER.debug("%s (%s): %s", message, url, content)
 
-        try:
-            _content = json.loads(content)
-        except (ValueError, TypeError):  # pragma: no cover
-            _content = str(content)
-
-        self.diagnostics[path] = {
-            DIAGNOSTIC_DATE_TIME: datetime.now().replace(microsecond=0).isoformat(),
-            DIAGNOSTIC_MESSAGE: message,
-            DIAGNOSTIC_CONTENT: _content,
-        }
+        self._diagnostics[path] = (datetime.now(), message, content)
@@ -22,6 +22,9 @@ from httpx import codes
 
 from .const import (
     CONF_BASIC_AUTH,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_WEBSOCKET,
+    DEFAULT_MAX_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
@@ -130,10 +133,20 @@ class LedFxConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_SCAN_INTERVAL)),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=user_input.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_SCAN_INTERVAL)),
                     vol.Required(
                         CONF_TIMEOUT,
                         default=user_input.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
                     ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_TIMEOUT)),
+                    vol.Required(
+                        CONF_WEBSOCKET,
+                        default=user_input.get(CONF_WEBSOCKET, False),
+                    ): cv.boolean,
                 }
             ),
             errors=errors,
@@ -228,10 +241,20 @@ class LedFxOptionsFlow(config_entries.OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_SCAN_INTERVAL)),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=user_input.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_SCAN_INTERVAL)),
                     vol.Required(
                         CONF_TIMEOUT,
                         default=user_input.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
                     ): vol.All(vol.Coerce(int), vol.Range(min=DEFAULT_TIMEOUT)),
+                    vol.Required(
+                        CONF_WEBSOCKET,
+                        default=user_input.get(CONF_WEBSOCKET, False),
+                    ): cv.boolean,
                 }
             ),
             errors=errors,
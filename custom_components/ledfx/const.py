@@ -25,6 +25,28 @@ PLATFORMS: Final = [
 DIAGNOSTIC_DATE_TIME: Final = "date_time"
 DIAGNOSTIC_MESSAGE: Final = "message"
 DIAGNOSTIC_CONTENT: Final = "content"
+DIAGNOSTIC_STATE: Final = "state"
+DIAGNOSTIC_FAILURES: Final = "failures"
+DIAGNOSTIC_TRANSITIONS: Final = "transitions"
+
+"""Statistic const"""
+STATISTIC_CONNECTIONS_NEW: Final = "connections_new"
+STATISTIC_CONNECTIONS_REUSED: Final = "connections_reused"
+STATISTIC_UNCHANGED_RESPONSES: Final = "unchanged_responses"
+STATISTIC_COALESCED_REQUESTS: Final = "coalesced_requests"
+STATISTIC_REQUESTS: Final = "requests"
+STATISTIC_WAITING: Final = "waiting"
+STATISTIC_MAX_WAITING: Final = "max_waiting"
+STATISTIC_WAIT_TIME: Final = "wait_time"
+STATISTIC_MAX_WAIT_TIME: Final = "max_wait_time"
+STATISTIC_THROTTLED: Final = "throttled"
+STATISTIC_REFRESHES: Final = "refreshes"
+STATISTIC_COALESCED_REFRESHES: Final = "coalesced_refreshes"
+STATISTIC_OVERRUNS: Final = "overruns"
+STATISTIC_DURATION: Final = "duration"
+STATISTIC_MAX_DURATION: Final = "max_duration"
+STATISTIC_LISTENER_CALLS: Final = "listener_calls"
+STATISTIC_SKIPPED_LISTENER_CALLS: Final = "skipped_listener_calls"
 
 """Helper const"""
 UPDATER: Final = "updater"
@@ -37,22 +59,70 @@ SIGNAL_NEW_SENSOR: Final = f"{DOMAIN}-new-sensor"
 SIGNAL_NEW_SWITCH: Final = f"{DOMAIN}-new-switch"
 OPTION_IS_FROM_FLOW: Final = "is_from_flow"
 
+"""Storage const"""
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
+
 """Custom conf"""
 CONF_BASIC_AUTH: Final = "basic_auth"
+CONF_WEBSOCKET: Final = "websocket"
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"
 
 """Default settings"""
 DEFAULT_SCAN_INTERVAL: Final = 7
+DEFAULT_MAX_SCAN_INTERVAL: Final = 60
+DEFAULT_ACTIVE_PERIOD: Final = 30
+DEFAULT_IDLE_BACKOFF: Final = 1.5
+DEFAULT_UNREACHABLE_BACKOFF: Final = 3
+DEFAULT_CATALOG_INTERVAL: Final = 300
 DEFAULT_TIMEOUT: Final = 10
 DEFAULT_POST_TIMEOUT: Final = 60
+DEFAULT_CONNECT_TIMEOUT: Final = 5
+DEFAULT_POOL_TIMEOUT: Final = 10
+DEFAULT_REFRESH_DEADLINE: Final = 45
+DEFAULT_RETRIES: Final = 2
+DEFAULT_RETRY_BACKOFF: Final = 0.2
 DEFAULT_CALL_DELAY: Final = 1
 DEFAULT_SLEEP: Final = 3
+DEFAULT_WRITE_DELAY: Final = 0.2
+DEFAULT_DEVICE_REFRESH_DELAY: Final = 1
+DEFAULT_MAX_CONNECTIONS: Final = 4
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final = 4
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 2
+DEFAULT_RATE_LIMIT: Final = 10
+DEFAULT_RATE_BURST: Final = 10
+DEFAULT_KEEPALIVE_EXPIRY: Final = 60
+DEFAULT_WEBSOCKET_SCAN_INTERVAL: Final = 60
+DEFAULT_WEBSOCKET_BACKOFF: Final = 1
+DEFAULT_WEBSOCKET_MAX_BACKOFF: Final = 60
+DEFAULT_WEBSOCKET_HEARTBEAT: Final = 30
+DEFAULT_WEBSOCKET_STABLE_TIME: Final = 30
+DEFAULT_CIRCUIT_FAILURES: Final = 3
+DEFAULT_CIRCUIT_RESET_TIMEOUT: Final = 30
+DEFAULT_CIRCUIT_HISTORY: Final = 10
 
 """LedFx API client const"""
 CLIENT_URL: Final = "http://{ip}:{port}/api"
+WEBSOCKET_URL: Final = "ws://{ip}:{port}/api/websocket"
+
+# Read timeouts of GET requests and of writes by path or by its last
+# segment, other GET requests use the configured timeout and other writes
+# at least DEFAULT_POST_TIMEOUT.
+CLIENT_GET_TIMEOUTS: Final = {
+    "schema": 30,
+    "config": 20,
+    "virtuals": 5,
+}
+CLIENT_WRITE_TIMEOUTS: Final = {
+    "effects": 5,
+    "presets": 5,
+}
 
 """Attributes"""
 ATTR_STATE: Final = "state"
 ATTR_STATE_NAME: Final = "State"
+ATTR_UPDATE_INTERVAL: Final = "update_interval"
+ATTR_UPDATE_INTERVAL_NAME: Final = "Update interval"
 ATTR_DEVICE: Final = "device"
 ATTR_DEVICE_SW_VERSION: Final = "device_sw_version"
 ATTR_FIELD: Final = "field"
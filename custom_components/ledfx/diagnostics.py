@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 
-from .updater import async_get_updater
+from .updater import LedFxUpdater, async_get_updater
 
 TO_REDACT: Final = {
     CONF_PASSWORD,
@@ -26,13 +26,15 @@ async def async_get_config_entry_diagnostics(
 
     if _updater := async_get_updater(hass, config_entry.entry_id):
         if hasattr(_updater, "data"):
-            _data["data"] = async_redact_data(_updater.data, TO_REDACT)
+            _data["data"] = async_redact_data(_updater.flat_data, TO_REDACT)
 
         if len(_updater.client.diagnostics) > 0:
             _data["requests"] = async_redact_data(
                 _updater.client.diagnostics, TO_REDACT
             )
 
+        _data |= _get_statistics(_updater)
+
         if hasattr(_updater, "buttons") and _updater.buttons:
             _data["buttons"] = list(_updater.buttons.keys())
 
@@ -52,3 +54,30 @@ async def async_get_config_entry_diagnostics(
             _data["switches"] = list(_updater.switches.keys())
 
     return _data
+
+
+def _get_statistics(updater: LedFxUpdater) -> dict:
+    """Return request and refresh statistics.
+
+    :param updater: LedFxUpdater: LedFx updater object
+    :return dict: Statistics sections
+    """
+
+    _data: dict = {
+        "circuit": updater.client.circuit_diagnostics,
+        "scheduler": updater.client.scheduler.statistics,
+    }
+
+    if len(updater.client.statistics) > 0:
+        _data["statistics"] = updater.client.statistics
+
+    if updater.client.retries:
+        _data["retries"] = updater.client.retries
+
+    if hasattr(updater, "overruns") and updater.overruns:
+        _data["overruns"] = updater.overruns
+
+    if hasattr(updater, "refresh_statistics"):
+        _data["refresh"] = updater.refresh_statistics
+
+    return _data
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any
 
@@ -10,18 +9,10 @@ from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    ATTR_FIELD_TYPE,
-    ATTR_LIGHT_BRIGHTNESS,
-    ATTR_LIGHT_COLOR,
-    ATTR_LIGHT_EFFECT,
-    ATTR_LIGHT_EFFECT_CONFIG,
-    ATTR_STATE,
-    ATTRIBUTION,
-)
+from .const import ATTR_STATE, ATTRIBUTION
 from .enum import Version
 from .helper import generate_entity_id
-from .updater import LedFxUpdater, convert_brightness
+from .updater import LedFxDeviceState, LedFxUpdater, convert_brightness
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +23,8 @@ class LedFxEntity(CoordinatorEntity):
     _attr_attribution: str = ATTRIBUTION
     _attr_device_code: str | None = None
     _attr_field_type: str | None = None
+    _attr_source: str | tuple[str, ...] | None = None
+    _device_state: LedFxDeviceState
 
     def __init__(
         self,
@@ -68,6 +61,8 @@ class LedFxEntity(CoordinatorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
 
+        self.coordinator_context = self._attr_device_code
+
         await CoordinatorEntity.async_added_to_hass(self)
 
     @property
@@ -84,6 +79,14 @@ class LedFxEntity(CoordinatorEntity):
 
         raise NotImplementedError  # pragma: no cover
 
+    def _field_effects(self) -> tuple[str, ...]:
+        """Effects with the entity property in the current schema
+
+        :return tuple[str, ...]
+        """
+
+        return self._updater.effect_index.effects.get(self.entity_description.key, ())
+
     async def async_update_effect(
         self,
         code: str,
@@ -95,73 +98,31 @@ class LedFxEntity(CoordinatorEntity):
         :param value: Any: Value
         """
 
-        config: dict = dict(
-            self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            )
-            | {
-                ATTR_BRIGHTNESS: convert_brightness(
-                    min(
-                        float(
-                            self._updater.data.get(
-                                f"{self._attr_device_code}_{ATTR_LIGHT_BRIGHTNESS}", 0
-                            )
-                        ),
-                        255,
-                    )
-                )
-            }
-        )
-
-        if self._updater.version == Version.V2:
-            config |= {
-                "background_color": self._updater.data.get(
-                    f"{self._attr_device_code}_{ATTR_LIGHT_COLOR}"
-                )
-            }
-
-        config |= {code: value}
+        await self.async_update_effect_config({code: value})
 
-        effect: str | None = self._updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}"
-        )
+    async def async_update_effect_config(self, changes: dict) -> bool:
+        """Update several effect parameters with one write
 
-        if self._attr_device_code and effect:
-            await self._updater.client.effect(
-                self._attr_device_code,
-                effect,
-                self._convert_config(config, code, value),
-                self._updater.version == Version.V2,
-            )
+        :param changes: dict: Changed parameters
+        :return bool: Is queued
+        """
 
-            self._updater.data[
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}"
-            ] = {
-                code: value for code, value in config.items() if code != ATTR_BRIGHTNESS
-            }
+        state: LedFxDeviceState = self._device_state
 
-            self._updater.async_update_listeners()
+        config: dict = state.effect_config | {
+            ATTR_BRIGHTNESS: convert_brightness(min(float(state.brightness), 255))
+        }
 
-    def _convert_config(self, config: dict, code: str, value: Any) -> dict:
-        """Convert config
+        if self._updater.version == Version.V2:
+            config |= {"background_color": state.color}
 
-        :param config: dict
-        :param code: str: Code
-        :param value: Any: Value
-        :return dict
-        """
+        effect: str | None = state.effect
 
-        result: dict = copy.deepcopy(config)
+        if not self._attr_device_code or not effect:
+            return False
 
-        if (
-            code in self._updater.effect_properties
-            and self._updater.effect_properties[code][ATTR_FIELD_TYPE] == "color"
-        ):  # pragma: no cover
-            if value in self._updater.colors:
-                result[code] = self._updater.colors[value]
-            elif value in self._updater.gradients:
-                result[code] = self._updater.gradients[value]
-            else:
-                del result[code]
+        await self._updater.async_write_effect(
+            self._attr_device_code, effect, config, changes
+        )
 
-        return result
+        return True
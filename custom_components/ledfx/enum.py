@@ -21,6 +21,14 @@ class Version(Enum):
     V2 = 2
 
 
+class RequestPriority(Enum):
+    """RequestPriority enum, lower values are served first"""
+
+    INTERACTIVE = 0
+    STATE = 1
+    CATALOG = 2
+
+
 class ActionType(str, Enum):
     """ActionType enum"""
 
@@ -35,3 +43,27 @@ class EffectCategory(str, Enum):
     NONE = "none"
     DEFAULT = "default_presets"
     CUSTOM = "custom_presets"
+
+
+class RefreshTier(str, Enum):
+    """RefreshTier enum"""
+
+    CATALOG = "catalog"
+    STATE = "state"
+
+
+class CircuitState(str, Enum):
+    """CircuitState enum"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class WebsocketEvent(str, Enum):
+    """WebsocketEvent enum"""
+
+    EFFECT_SET = "effect_set"
+    EFFECT_CLEARED = "effect_cleared"
+    SCENE_ACTIVATED = "scene_activated"
+    VIRTUAL_CONFIG_UPDATE = "virtual_config_update"
@@ -11,3 +11,7 @@ class LedFxConnectionError(LedFxError):
 
 class LedFxRequestError(LedFxError):
     """LedFx request error"""
+
+
+class LedFxNotModified(LedFxError):
+    """LedFx response not modified"""
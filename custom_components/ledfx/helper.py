@@ -129,33 +129,6 @@ def generate_entity_id(
     return entity_id_format.format(slugify(f"ledfx_{ip_address}{_name}".lower()))
 
 
-def build_effects(
-    effects: list, default_presets: dict[str, list], custom_presets: dict[str, list]
-) -> list:
-    """Build effects
-
-    :param effects: list: Effects list
-    :param default_presets: dict[str, list]: Default presets list
-    :param custom_presets: dict[str, list]: Custom presets list
-    :return list
-    """
-
-    full_effects: list = []
-
-    for effect in effects:
-        full_effects.append(effect)
-        full_effects += [
-            f"{effect} - {preset}" for preset in default_presets.get(effect, [])
-        ]
-        full_effects += [
-            f"{effect} - {preset}"
-            for preset in custom_presets.get(effect, [])
-            if effect in custom_presets
-        ]
-
-    return full_effects
-
-
 def find_effect(
     effect: str, default_presets: dict[str, list], custom_presets: dict[str, list]
 ) -> tuple[str | None, str | None, EffectCategory]:
@@ -24,22 +24,15 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
-    ATTR_LIGHT_BRIGHTNESS,
-    ATTR_LIGHT_COLOR,
-    ATTR_LIGHT_CONFIG,
     ATTR_LIGHT_CUSTOM_PRESETS,
     ATTR_LIGHT_DEFAULT_PRESETS,
-    ATTR_LIGHT_EFFECT,
-    ATTR_LIGHT_EFFECT_CONFIG,
-    ATTR_LIGHT_EFFECTS,
-    ATTR_LIGHT_STATE,
-    ATTR_STATE,
     SIGNAL_NEW_DEVICE,
 )
 from .entity import LedFxEntity
 from .enum import ActionType, EffectCategory, Version
-from .helper import build_effects, find_effect, hex_to_rgbw, rgbw_to_hex
+from .helper import find_effect, hex_to_rgbw, rgbw_to_hex
 from .updater import (
+    LedFxDeviceState,
     LedFxEntityDescription,
     LedFxUpdater,
     async_get_updater,
@@ -113,8 +106,11 @@ class LedFxLight(LedFxEntity, LightEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
         self._type = entity.type
         self._attr_device_code = entity.description.key
+        self._device_state = updater.device_state(self._attr_device_code)
 
         self._attr_device_info = entity.device_info
 
@@ -125,63 +121,35 @@ class LedFxLight(LedFxEntity, LightEntity):
             self._attr_supported_color_modes = {ColorMode.RGBW, ColorMode.ONOFF}
             self._attr_color_mode = ColorMode.RGBW
 
-        self._attr_is_on = updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_STATE}", False
-        )
-        self._attr_brightness = min(
-            updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_BRIGHTNESS}", 0),
-            255,
-        )
+        self._attr_is_on = self._device_state.state
+        self._attr_brightness = min(self._device_state.brightness, 255)  # type: ignore
 
-        self._attr_rgbw_color = hex_to_rgbw(
-            updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_COLOR}", None)
-        )
+        self._attr_rgbw_color = hex_to_rgbw(self._device_state.color)
 
-        self._attr_effect_list = build_effects(
-            updater.data.get(ATTR_LIGHT_EFFECTS, []),
-            updater.data.get(ATTR_LIGHT_DEFAULT_PRESETS, {}),
-            updater.data.get(ATTR_LIGHT_CUSTOM_PRESETS, {}),
+        self._attr_effect_list = updater.effect_list  # type: ignore
+        self._attr_effect = self._device_state.effect
+        self._attr_extra_state_attributes = (
+            self._device_state.effect_config | self._device_state.config
         )
-        self._attr_effect = updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}"
-        )
-        self._attr_extra_state_attributes = updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-        ) | updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_CONFIG}", {})
 
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
-        is_available: bool = self._updater.data.get(ATTR_STATE, False)
+        is_available: bool = self._updater.is_available(self._attr_source)
 
-        is_on: bool = self._updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_STATE}", False
-        )
-        brightness: int = min(
-            self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_BRIGHTNESS}", 0
-            ),
-            255,
-        )
-        color: tuple | None = hex_to_rgbw(
-            self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_COLOR}", None)
-        )
+        state: LedFxDeviceState = self._device_state
 
-        effect_list = build_effects(
-            self._updater.data.get(ATTR_LIGHT_EFFECTS, []),
-            self._updater.data.get(ATTR_LIGHT_DEFAULT_PRESETS, {}),
-            self._updater.data.get(ATTR_LIGHT_CUSTOM_PRESETS, {}),
-        )
-        effect: str | None = self._updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}"
-        )
+        is_on: bool = state.state
+        brightness: int = min(state.brightness, 255)  # type: ignore
+        color: tuple | None = hex_to_rgbw(state.color)
+
+        effect_list: tuple[str, ...] = self._updater.effect_list
+        effect: str | None = state.effect
         attributes: dict = {
             code: value
-            for code, value in self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            ).items()
+            for code, value in state.effect_config.items()
             if code != ATTR_BRIGHTNESS
-        } | self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_CONFIG}", {})
+        } | state.config
 
         if (  # pylint: disable=too-many-boolean-expressions
             self._attr_is_on == is_on
@@ -189,7 +157,7 @@ class LedFxLight(LedFxEntity, LightEntity):
             and self._attr_brightness == brightness
             and self._attr_rgbw_color == color
             and self._attr_effect == effect
-            and self._attr_effect_list == effect_list
+            and self._attr_effect_list is effect_list
             and self._attr_extra_state_attributes == attributes
         ):
             return
@@ -198,16 +166,20 @@ class LedFxLight(LedFxEntity, LightEntity):
         self._attr_is_on = is_on
         self._attr_brightness = brightness
         self._attr_rgbw_color = color  # type: ignore
-        self._attr_effect_list = effect_list
+        self._attr_effect_list = effect_list  # type: ignore
         self._attr_effect = effect
         self._attr_extra_state_attributes = attributes
 
         self.async_write_ha_state()
 
-    async def _device_on(self, **kwargs: Any) -> None:
+    async def _device_on(self, **kwargs: Any) -> bool:
         """Device on action
 
+        Brightness and color are sent together with the effect when possible,
+        so one turn on results in as few requests as possible.
+
         :param kwargs: Any: Any arguments
+        :return bool: Is effect write queued
         """
 
         is_virtual: bool = self._updater.version == Version.V2
@@ -215,6 +187,16 @@ class LedFxLight(LedFxEntity, LightEntity):
         old_effect: str | None = self._attr_effect
         category: EffectCategory = EffectCategory.NONE
 
+        changes: dict = {}
+
+        if ATTR_BRIGHTNESS in kwargs:
+            changes[ATTR_BRIGHTNESS] = convert_brightness(
+                float(kwargs[ATTR_BRIGHTNESS])
+            )
+
+        if ATTR_RGBW_COLOR in kwargs:
+            changes["background_color"] = rgbw_to_hex(kwargs[ATTR_RGBW_COLOR])
+
         if ATTR_EFFECT in kwargs:
             self._attr_effect, preset, category = find_effect(
                 kwargs[ATTR_EFFECT],
@@ -227,21 +209,25 @@ class LedFxLight(LedFxEntity, LightEntity):
             or not self._attr_is_on
             or preset is not None
         ):
-            response: dict = dict(
-                await self._updater.client.preset(
+            response: dict = {}
+
+            if category != EffectCategory.NONE and preset is not None:
+                response = await self._updater.client.preset(
                     self._attr_device_code,  # type: ignore
                     category.value,
                     self._attr_effect,  # type: ignore
                     preset,  # type: ignore
                     is_virtual,
                 )
-                if category != EffectCategory.NONE and preset is not None
-                else await self._updater.client.device_on(
+            else:
+                response = await self._updater.client.device_on(
                     self._attr_device_code,  # type: ignore
                     self._attr_effect,  # type: ignore
                     is_virtual,
+                    changes,
                 )
-            )
+
+                changes = {}
 
             effect_config: dict = {}
             if "effect" in response:
@@ -251,38 +237,31 @@ class LedFxLight(LedFxEntity, LightEntity):
                     if not isinstance(value, dict) and not isinstance(value, list)
                 }
 
-            self._updater.data[
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}"
-            ] = self._attr_effect
-
-            self._updater.data[
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}"
-            ] = {
+            self._device_state.effect = self._attr_effect
+            self._device_state.effect_config = {
                 code: value
                 for code, value in effect_config.items()
                 if code != ATTR_BRIGHTNESS
             }
 
-        if ATTR_BRIGHTNESS in kwargs:
-            await self.async_update_effect(
-                ATTR_BRIGHTNESS, convert_brightness(float(kwargs[ATTR_BRIGHTNESS]))
-            )
+        if changes:
+            return await self.async_update_effect_config(changes)
 
-        if ATTR_RGBW_COLOR in kwargs:
-            await self.async_update_effect(
-                "background_color", rgbw_to_hex(kwargs[ATTR_RGBW_COLOR])
-            )
+        return False
 
-    async def _device_off(self, **kwargs: Any) -> None:
+    async def _device_off(self, **kwargs: Any) -> bool:
         """Device off action
 
         :param kwargs: Any: Any arguments
+        :return bool: Is effect write queued
         """
 
         await self._updater.client.device_off(
             self._attr_device_code, self._updater.version == Version.V2  # type: ignore
         )
 
+        return False
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on action
 
@@ -308,38 +287,36 @@ class LedFxLight(LedFxEntity, LightEntity):
         """
 
         if action := getattr(self, method):
-            await action(**kwargs)
+            is_written: bool = await action(**kwargs)
 
-            self._updater.data[f"{self._attr_device_code}_{ATTR_LIGHT_STATE}"] = (
-                state == STATE_ON
+            self._updater.async_mark_active()
+            self._updater.async_schedule_device_refresh(
+                self._attr_device_code  # type: ignore
             )
+
+            self._device_state.state = state == STATE_ON
             self._attr_is_on = state == STATE_ON
 
             if ATTR_BRIGHTNESS in kwargs:
                 self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
-                self._updater.data[
-                    f"{self._attr_device_code}_{ATTR_LIGHT_BRIGHTNESS}"
-                ] = self._attr_brightness
+                self._device_state.brightness = self._attr_brightness  # type: ignore
 
             if ATTR_RGBW_COLOR in kwargs:
                 self._attr_rgbw_color = kwargs[ATTR_RGBW_COLOR]
-                self._updater.data[
-                    f"{self._attr_device_code}_{ATTR_LIGHT_COLOR}"
-                ] = rgbw_to_hex(
-                    self._attr_rgbw_color
-                )  # type: ignore
+                self._device_state.color = rgbw_to_hex(
+                    self._attr_rgbw_color  # type: ignore
+                )
 
             self._attr_extra_state_attributes = {
                 code: value
-                for code, value in self._updater.data.get(
-                    f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-                ).items()
+                for code, value in self._device_state.effect_config.items()
                 if code != ATTR_BRIGHTNESS
-            } | self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_CONFIG}", {}
-            )
+            } | self._device_state.config
 
-            if ATTR_BRIGHTNESS not in kwargs and ATTR_RGBW_COLOR not in kwargs:
-                self._updater.async_update_listeners()
+            # A sent effect write has already updated the device entities.
+            if not is_written:
+                self._updater.async_update_device_listeners(
+                    self._attr_device_code  # type: ignore
+                )
 
             self.async_write_ha_state()
@@ -14,10 +14,6 @@ from .const import (
     ATTR_DEVICE,
     ATTR_FIELD_EFFECTS,
     ATTR_FIELD_TYPE,
-    ATTR_LIGHT_EFFECT,
-    ATTR_LIGHT_EFFECT_CONFIG,
-    ATTR_LIGHT_STATE,
-    ATTR_STATE,
     NUMBER_ICONS,
     SIGNAL_NEW_NUMBER,
 )
@@ -92,12 +88,15 @@ class LedFxNumber(LedFxEntity, NumberEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
         self._type = entity.type
         self._attr_device_info = entity.device_info
         self._attr_available: bool = True
         self._attr_mode = NumberMode.SLIDER
 
         self._attr_device_code = entity.device_code
+        self._device_state = updater.device_state(entity.device_code)
 
         self.entity_id = generate_entity_id(
             ENTITY_ID_FORMAT,
@@ -105,25 +104,24 @@ class LedFxNumber(LedFxEntity, NumberEntity):
             f"{entity.device_code}_{entity.description.key}",
         )
 
-        self._attr_native_value = updater.data.get(
-            f"{entity.device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-        ).get(entity.description.key)
+        self._attr_native_value = self._device_state.effect_config.get(
+            entity.description.key
+        )
 
         self._attr_extra_state_attributes = {
             ATTR_DEVICE: self._attr_device_code,
-            ATTR_FIELD_EFFECTS: entity.extra.get(ATTR_FIELD_EFFECTS, [])
-            if entity.extra
-            else [],
+            ATTR_FIELD_EFFECTS: self._field_effects(),
         }
 
         if entity.extra:
             self._attr_field_type = entity.extra.get(ATTR_FIELD_TYPE)
 
         self._attr_available = bool(
-            updater.data.get(ATTR_STATE, False)
-            and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_STATE}")
-            and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}")
-            in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
+            updater.is_available(self._attr_source)
+            and self._device_state.state
+            and self._updater.effect_index.supports(
+                self._device_state.effect, self.entity_description.key
+            )
         )
 
         if entity.description.key in NUMBER_ICONS:
@@ -132,22 +130,30 @@ class LedFxNumber(LedFxEntity, NumberEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
-        value: float | int = self._updater.data.get(
-            f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-        ).get(self.entity_description.key)
+        value: float | int = self._device_state.effect_config.get(
+            self.entity_description.key
+        )
 
         is_available: bool = bool(
-            self._updater.data.get(ATTR_STATE, False)
-            and self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_STATE}")
-            and self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}")
-            in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
+            self._updater.is_available(self._attr_source)
+            and self._device_state.state
+            and self._updater.effect_index.supports(
+                self._device_state.effect, self.entity_description.key
+            )
         )
 
-        if self._attr_native_value == value and self._attr_available == is_available:
+        effects: tuple[str, ...] = self._field_effects()
+
+        if (
+            self._attr_native_value == value
+            and self._attr_available == is_available
+            and self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] == effects
+        ):
             return
 
         self._attr_available = is_available
         self._attr_native_value = value
+        self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] = effects
 
         self.async_write_ha_state()
 
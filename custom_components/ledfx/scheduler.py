@@ -0,0 +1,210 @@
+"""LedFx request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from .const import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    STATISTIC_MAX_WAIT_TIME,
+    STATISTIC_MAX_WAITING,
+    STATISTIC_REQUESTS,
+    STATISTIC_THROTTLED,
+    STATISTIC_WAIT_TIME,
+    STATISTIC_WAITING,
+)
+from .enum import RequestPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LedFxRequestScheduler:
+    """Limit concurrent requests to one LedFx instance by priority.
+
+    Waiting requests are served by priority class and in arrival order
+    within a class. Catalog requests are deferred while interactive
+    requests are waiting or running. Started requests are additionally
+    limited by a token bucket.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
+    ) -> None:
+        """Initialize scheduler.
+
+        :param max_concurrent: int: Concurrent requests limit
+        :param rate_limit: float | None: Requests per second, None to disable
+        :param rate_burst: int: Token bucket size
+        """
+
+        self._max_concurrent: int = max(max_concurrent, 1)
+        self._rate_limit: float | None = rate_limit
+        self._rate_burst: int = max(rate_burst, 1)
+        self._tokens: float = self._rate_burst
+        self._tokens_at: float = time.monotonic()
+        self._active: dict[RequestPriority, int] = {
+            priority: 0 for priority in RequestPriority
+        }
+        self._waiting: list[tuple[int, int, RequestPriority, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self.statistics: dict[str, dict[str, float]] = {
+            priority.name.lower(): {
+                STATISTIC_REQUESTS: 0,
+                STATISTIC_WAITING: 0,
+                STATISTIC_MAX_WAITING: 0,
+                STATISTIC_WAIT_TIME: 0.0,
+                STATISTIC_MAX_WAIT_TIME: 0.0,
+                STATISTIC_THROTTLED: 0,
+            }
+            for priority in RequestPriority
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold a request slot.
+
+        :param priority: RequestPriority: Request priority
+        """
+
+        started: float = time.monotonic()
+        statistics: dict[str, float] = self.statistics[priority.name.lower()]
+
+        if self._can_start(priority):
+            self._active[priority] += 1
+        else:
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._waiting, (priority.value, next(self._sequence), priority, future)
+            )
+
+            statistics[STATISTIC_WAITING] += 1
+            statistics[STATISTIC_MAX_WAITING] = max(
+                statistics[STATISTIC_MAX_WAITING], statistics[STATISTIC_WAITING]
+            )
+
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release(priority)
+                else:
+                    future.cancel()
+                    self._grant()
+
+                raise
+            finally:
+                statistics[STATISTIC_WAITING] -= 1
+
+        try:
+            await self._async_take_token(statistics)
+
+            wait_time: float = time.monotonic() - started
+
+            statistics[STATISTIC_REQUESTS] += 1
+            statistics[STATISTIC_WAIT_TIME] += wait_time
+            statistics[STATISTIC_MAX_WAIT_TIME] = max(
+                statistics[STATISTIC_MAX_WAIT_TIME], wait_time
+            )
+
+            yield
+        finally:
+            self._release(priority)
+
+    async def _async_take_token(self, statistics: dict[str, float]) -> None:
+        """Wait for a token of the rate limit bucket.
+
+        :param statistics: dict[str, float]: Statistics of the priority class
+        """
+
+        if not self._rate_limit:
+            return
+
+        is_throttled: bool = False
+
+        while True:
+            now: float = time.monotonic()
+
+            self._tokens = min(
+                self._rate_burst,
+                self._tokens + (now - self._tokens_at) * self._rate_limit,
+            )
+            self._tokens_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+
+                return
+
+            if not is_throttled:
+                is_throttled = True
+                statistics[STATISTIC_THROTTLED] += 1
+
+            await asyncio.sleep((1 - self._tokens) / self._rate_limit)
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        """Can a request of the priority start now.
+
+        :param priority: RequestPriority: Request priority
+        :return bool: True if a slot is free and nothing more urgent waits
+        """
+
+        if sum(self._active.values()) >= self._max_concurrent:
+            return False
+
+        if any(
+            not future.done() and _priority.value <= priority.value
+            for _, _, _priority, future in self._waiting
+        ):
+            return False
+
+        return priority != RequestPriority.CATALOG or (
+            self._active[RequestPriority.INTERACTIVE] == 0
+            and not any(
+                not future.done() and _priority == RequestPriority.INTERACTIVE
+                for _, _, _priority, future in self._waiting
+            )
+        )
+
+    def _release(self, priority: RequestPriority) -> None:
+        """Release a slot.
+
+        :param priority: RequestPriority: Request priority
+        """
+
+        self._active[priority] -= 1
+
+        self._grant()
+
+    def _grant(self) -> None:
+        """Start the most urgent waiting requests while slots are free."""
+
+        while self._waiting:
+            _, _, _priority, future = self._waiting[0]
+
+            if future.done():
+                heapq.heappop(self._waiting)
+
+                continue
+
+            if sum(self._active.values()) >= self._max_concurrent or (
+                _priority == RequestPriority.CATALOG
+                and self._active[RequestPriority.INTERACTIVE] > 0
+            ):
+                return
+
+            heapq.heappop(self._waiting)
+
+            self._active[_priority] += 1
+            future.set_result(None)
@@ -21,13 +21,9 @@ from .const import (
     ATTR_FIELD_EFFECTS,
     ATTR_FIELD_OPTIONS,
     ATTR_FIELD_TYPE,
-    ATTR_LIGHT_EFFECT,
-    ATTR_LIGHT_EFFECT_CONFIG,
-    ATTR_LIGHT_STATE,
     ATTR_SELECT_AUDIO_INPUT,
     ATTR_SELECT_AUDIO_INPUT_NAME,
     ATTR_SELECT_AUDIO_INPUT_OPTIONS,
-    ATTR_STATE,
     SELECT_ICONS,
     SIGNAL_NEW_SELECT,
 )
@@ -91,7 +87,15 @@ async def async_setup_entry(
 
     for select in SELECTS:
         add_select(
-            LedFxEntityDescription(description=select, device_info=updater.device_info)
+            LedFxEntityDescription(
+                description=select,
+                device_info=updater.device_info,
+                # The value comes from the config, the options from the audio
+                # devices on V1 and from the schema on V2.
+                source=("config", "audio_devices")
+                if updater.version == Version.V1
+                else ("config", "schema"),
+            )
         )
 
     for select in updater.selects.values():
@@ -125,12 +129,15 @@ class LedFxSelect(LedFxEntity, SelectEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
         self._type = entity.type
         self._attr_device_info = entity.device_info
         self._attr_available: bool = True
 
         if entity.type == ActionType.DEVICE:
             self._attr_device_code = entity.device_code
+            self._device_state = updater.device_state(entity.device_code)
 
             self.entity_id = generate_entity_id(
                 ENTITY_ID_FORMAT,
@@ -138,9 +145,9 @@ class LedFxSelect(LedFxEntity, SelectEntity):
                 f"{entity.device_code}_{entity.description.key}",
             )
 
-            self._attr_current_option = updater.data.get(
-                f"{entity.device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            ).get(entity.description.key)
+            self._attr_current_option = self._device_state.effect_config.get(
+                entity.description.key
+            )
 
             self._attr_options = (
                 entity.extra.get(ATTR_FIELD_OPTIONS, []) if entity.extra else []
@@ -151,17 +158,16 @@ class LedFxSelect(LedFxEntity, SelectEntity):
 
             self._attr_extra_state_attributes = {
                 ATTR_DEVICE: self._attr_device_code,
-                ATTR_FIELD_EFFECTS: entity.extra.get(ATTR_FIELD_EFFECTS, [])
-                if entity.extra
-                else [],
+                ATTR_FIELD_EFFECTS: self._field_effects(),
             }
 
             self._attr_available = bool(
-                updater.data.get(ATTR_STATE, False)
+                updater.is_available(self._attr_source)
                 and len(self._attr_options) > 0
-                and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_STATE}")
-                and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}")
-                in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
+                and self._device_state.state
+                and self._updater.effect_index.supports(
+                    self._device_state.effect, self.entity_description.key
+                )
             )
 
             if entity.description.key in SELECT_ICONS:
@@ -183,7 +189,7 @@ class LedFxSelect(LedFxEntity, SelectEntity):
         )
 
         self._attr_available = bool(
-            updater.data.get(ATTR_STATE, False) and len(self._attr_options) > 0
+            updater.is_available(self._attr_source) and len(self._attr_options) > 0
         )
 
     def _handle_coordinator_update(self) -> None:
@@ -192,36 +198,40 @@ class LedFxSelect(LedFxEntity, SelectEntity):
         is_available: bool = self._attr_available
         current_option: str = self._attr_current_option
         options: dict | list = self._attr_options
+        effects: tuple[str, ...] | None = None
 
         if self._type == ActionType.DEVICE:
-            current_option = self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            ).get(self.entity_description.key)
+            current_option = self._device_state.effect_config.get(
+                self.entity_description.key
+            )
 
             is_available = bool(
-                self._updater.data.get(ATTR_STATE, False)
+                self._updater.is_available(self._attr_source)
                 and len(options) > 0
-                and self._updater.data.get(
-                    f"{self._attr_device_code}_{ATTR_LIGHT_STATE}"
+                and self._device_state.state
+                and self._updater.effect_index.supports(
+                    self._device_state.effect, self.entity_description.key
                 )
-                and self._updater.data.get(
-                    f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}"
-                )
-                in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
             )
+
+            effects = self._field_effects()
         else:
             current_option = self._updater.data.get(self.entity_description.key, False)
             options = self._updater.data.get(self._options_key, [])
             options = list(options.values()) if isinstance(options, dict) else options
 
             is_available = bool(
-                self._updater.data.get(ATTR_STATE, False) and len(options) > 0
+                self._updater.is_available(self._attr_source) and len(options) > 0
             )
 
         if (
             self._attr_current_option == current_option
             and self._attr_options == options
             and self._attr_available == is_available
+            and (
+                effects is None
+                or self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] == effects
+            )
         ):
             return
 
@@ -229,6 +239,9 @@ class LedFxSelect(LedFxEntity, SelectEntity):
         self._attr_current_option = current_option
         self._attr_options = options
 
+        if effects is not None:
+            self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] = effects
+
         self.async_write_ha_state()
 
     async def _audio_input_change(self, option: str) -> bool:
@@ -245,6 +258,8 @@ class LedFxSelect(LedFxEntity, SelectEntity):
                     int(option_ids[0]), self._updater.version == Version.V2
                 )
 
+                self._updater.async_mark_active()
+
                 return True
             except LedFxError as _e:
                 _LOGGER.debug("Audio input update error: %r", _e)
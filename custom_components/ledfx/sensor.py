@@ -5,18 +5,40 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import ENTITY_ID_FORMAT, SensorEntity
+from homeassistant.components.sensor import (
+    ENTITY_ID_FORMAT,
+    SensorEntity,
+    SensorEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import ATTR_STATE, SENSOR_ICONS, SIGNAL_NEW_SENSOR
+from .const import (
+    ATTR_UPDATE_INTERVAL,
+    ATTR_UPDATE_INTERVAL_NAME,
+    SENSOR_ICONS,
+    SIGNAL_NEW_SENSOR,
+)
 from .entity import LedFxEntity
 from .updater import LedFxEntityDescription, LedFxUpdater, async_get_updater
 
 PARALLEL_UPDATES = 0
 
+SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=ATTR_UPDATE_INTERVAL,
+        name=ATTR_UPDATE_INTERVAL_NAME,
+        icon="mdi:timer-sync-outline",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -51,6 +73,13 @@ async def async_setup_entry(
             ]
         )
 
+    for description in SENSORS:
+        add_sensor(
+            LedFxEntityDescription(
+                description=description, device_info=updater.device_info
+            )
+        )
+
     for sensor in updater.sensors.values():
         add_sensor(sensor)
 
@@ -79,6 +108,13 @@ class LedFxSensor(LedFxEntity, SensorEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
+        self._attr_available = (
+            updater.is_available(self._attr_source)
+            if entity.description.key != ATTR_UPDATE_INTERVAL
+            else True
+        )
         self._attr_native_value = self._updater.data.get(entity.description.key, None)
         self._attr_device_info = entity.device_info
 
@@ -88,7 +124,11 @@ class LedFxSensor(LedFxEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update state."""
 
-        is_available: bool = self._updater.data.get(ATTR_STATE, False)
+        is_available: bool = (
+            self._updater.is_available(self._attr_source)
+            if self.entity_description.key != ATTR_UPDATE_INTERVAL
+            else True
+        )
 
         state: Any = self._updater.data.get(self.entity_description.key, None)
 
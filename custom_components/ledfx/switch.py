@@ -15,10 +15,6 @@ from .const import (
     ATTR_DEVICE,
     ATTR_FIELD_EFFECTS,
     ATTR_FIELD_TYPE,
-    ATTR_LIGHT_EFFECT,
-    ATTR_LIGHT_EFFECT_CONFIG,
-    ATTR_LIGHT_STATE,
-    ATTR_STATE,
     SIGNAL_NEW_SWITCH,
     SWITCH_ICONS,
 )
@@ -94,11 +90,14 @@ class LedFxSwitch(LedFxEntity, SwitchEntity):
             self, unique_id, entity.description, updater, ENTITY_ID_FORMAT
         )
 
+        self._attr_source = entity.source
+
         self._type = entity.type
         self._attr_device_info = entity.device_info
         self._attr_available: bool = True
 
         self._attr_device_code = entity.device_code
+        self._device_state = updater.device_state(entity.device_code)
 
         self.entity_id = generate_entity_id(
             ENTITY_ID_FORMAT,
@@ -107,26 +106,23 @@ class LedFxSwitch(LedFxEntity, SwitchEntity):
         )
 
         self._attr_is_on = bool(
-            updater.data.get(
-                f"{entity.device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            ).get(entity.description.key, False)
+            self._device_state.effect_config.get(entity.description.key, False)
         )
 
         self._attr_extra_state_attributes = {
             ATTR_DEVICE: self._attr_device_code,
-            ATTR_FIELD_EFFECTS: entity.extra.get(ATTR_FIELD_EFFECTS, [])
-            if entity.extra
-            else [],
+            ATTR_FIELD_EFFECTS: self._field_effects(),
         }
 
         if entity.extra:
             self._attr_field_type = entity.extra.get(ATTR_FIELD_TYPE)
 
         self._attr_available = bool(
-            updater.data.get(ATTR_STATE, False)
-            and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_STATE}")
-            and updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}")
-            in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
+            updater.is_available(self._attr_source)
+            and self._device_state.state
+            and self._updater.effect_index.supports(
+                self._device_state.effect, self.entity_description.key
+            )
         )
 
         if entity.description.key in SWITCH_ICONS:
@@ -136,23 +132,29 @@ class LedFxSwitch(LedFxEntity, SwitchEntity):
         """Update state."""
 
         is_on: bool = bool(
-            self._updater.data.get(
-                f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT_CONFIG}", {}
-            ).get(self.entity_description.key, False)
+            self._device_state.effect_config.get(self.entity_description.key, False)
         )
 
         is_available: bool = bool(
-            self._updater.data.get(ATTR_STATE, False)
-            and self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_STATE}")
-            and self._updater.data.get(f"{self._attr_device_code}_{ATTR_LIGHT_EFFECT}")
-            in self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS]
+            self._updater.is_available(self._attr_source)
+            and self._device_state.state
+            and self._updater.effect_index.supports(
+                self._device_state.effect, self.entity_description.key
+            )
         )
 
-        if self._attr_is_on == is_on and self._attr_available == is_available:
+        effects: tuple[str, ...] = self._field_effects()
+
+        if (
+            self._attr_is_on == is_on
+            and self._attr_available == is_available
+            and self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] == effects
+        ):
             return
 
         self._attr_available = is_available
         self._attr_is_on = is_on
+        self._attr_extra_state_attributes[ATTR_FIELD_EFFECTS] = effects
 
         self.async_write_ha_state()
 
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import dataclasses
 import logging
 import math
-from dataclasses import dataclass
-from datetime import timedelta
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from functools import cached_property
+from types import MappingProxyType
 from typing import Any, Final
 
 from homeassistant.components.button import ButtonEntityDescription
-from homeassistant.components.light import LightEntityDescription
+from homeassistant.components.light import ATTR_BRIGHTNESS, LightEntityDescription
 from homeassistant.components.number import NumberEntityDescription
 from homeassistant.components.select import SelectEntityDescription
 from homeassistant.components.sensor import SensorEntityDescription, SensorStateClass
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntityDescription
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import event
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import (
     DeviceEntryType,
@@ -24,10 +31,11 @@ from homeassistant.helpers.entity import (
     EntityCategory,
     EntityDescription,
 )
-from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.helpers.httpx_client import create_async_httpx_client
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import utcnow
-from httpx import USE_CLIENT_DEFAULT, codes
+from httpx import USE_CLIENT_DEFAULT, AsyncClient, Limits, codes
 
 from .client import LedFxClient
 from .const import (
@@ -48,8 +56,21 @@ from .const import (
     ATTR_SELECT_AUDIO_INPUT,
     ATTR_SELECT_AUDIO_INPUT_OPTIONS,
     ATTR_STATE,
+    ATTR_UPDATE_INTERVAL,
+    DEFAULT_ACTIVE_PERIOD,
+    DEFAULT_CATALOG_INTERVAL,
+    DEFAULT_DEVICE_REFRESH_DELAY,
+    DEFAULT_IDLE_BACKOFF,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_REFRESH_DEADLINE,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
+    DEFAULT_UNREACHABLE_BACKOFF,
+    DEFAULT_WEBSOCKET_SCAN_INTERVAL,
+    DEFAULT_WRITE_DELAY,
     DOMAIN,
     MAINTAINER,
     NAME,
@@ -59,19 +80,46 @@ from .const import (
     SIGNAL_NEW_SELECT,
     SIGNAL_NEW_SENSOR,
     SIGNAL_NEW_SWITCH,
+    STATISTIC_COALESCED_REFRESHES,
+    STATISTIC_DURATION,
+    STATISTIC_LISTENER_CALLS,
+    STATISTIC_MAX_DURATION,
+    STATISTIC_OVERRUNS,
+    STATISTIC_REFRESHES,
+    STATISTIC_SKIPPED_LISTENER_CALLS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     UPDATER,
 )
-from .enum import ActionType, Version
-from .exceptions import LedFxConnectionError, LedFxError, LedFxRequestError
-
-PREPARE_METHODS_V1: Final = (
-    "config",
-    "info",
-    "colors",
-    "schema",
-    "devices",
-    "audio_devices",
-    "scenes",
+from .enum import ActionType, RefreshTier, Version, WebsocketEvent
+from .exceptions import (
+    LedFxConnectionError,
+    LedFxError,
+    LedFxNotModified,
+    LedFxRequestError,
+)
+from .websocket import LedFxWebsocket
+
+# Prepare methods with their refresh tier and the methods they depend on.
+# Independent methods run concurrently, the rest wait for their dependencies.
+# Catalog methods only run when the catalog is due, state methods run on every
+# refresh.
+PREPARE_METHODS: Final = {
+    "config": (RefreshTier.CATALOG, ()),
+    "info": (RefreshTier.CATALOG, ("config",)),
+    "colors": (RefreshTier.CATALOG, ("config",)),
+    "schema": (RefreshTier.CATALOG, ("config", "colors")),
+    "devices": (RefreshTier.STATE, ("schema",)),
+    "audio_devices": (RefreshTier.CATALOG, ("schema",)),
+    "scenes": (RefreshTier.CATALOG, ()),
+}
+
+# Global keys read by the entities of every device
+SHARED_KEYS: Final = (
+    ATTR_STATE,
+    ATTR_LIGHT_EFFECTS,
+    ATTR_LIGHT_DEFAULT_PRESETS,
+    ATTR_LIGHT_CUSTOM_PRESETS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -96,6 +144,8 @@ class LedFxUpdater(DataUpdateCoordinator):
     new_switch_callback: CALLBACK_TYPE | None = None
 
     _scan_interval: int
+    _max_scan_interval: int
+    _catalog_interval: int
     _is_only_check: bool = False
 
     def __init__(
@@ -107,6 +157,12 @@ class LedFxUpdater(DataUpdateCoordinator):
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
         timeout: int = DEFAULT_TIMEOUT,
         is_only_check: bool = False,
+        limits: Limits | None = None,
+        catalog_interval: int = DEFAULT_CATALOG_INTERVAL,
+        entry_id: str | None = None,
+        is_websocket: bool = False,
+        max_scan_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+        **client_options: Any,
     ) -> None:
         """Initialize updater.
 
@@ -118,20 +174,35 @@ class LedFxUpdater(DataUpdateCoordinator):
         :param scan_interval: int: Update interval
         :param timeout: int: Query execution timeout
         :param is_only_check: bool: Only config flow
+        :param limits: Limits | None: Connection pool limits
+        :param catalog_interval: int: Catalog update interval
+        :param entry_id: str | None: Config entry id used for the snapshot store
+        :param is_websocket: bool: Subscribe to LedFx events
+        :param max_scan_interval: int: Longest update interval while idle
+        :param client_options: Any: LedFxClient options, e.g. rate_limit
         """
 
+        self._http_client: AsyncClient = create_async_httpx_client(
+            hass,
+            verify_ssl=False,
+            limits=limits
+            or Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
         self.client = LedFxClient(
-            get_async_client(hass, False),
-            ip,
-            port,
-            auth,
-            timeout,
+            self._http_client, ip, port, auth, timeout, **client_options
         )
 
         self.ip = ip  # pylint: disable=invalid-name
         self.port = port
 
         self._scan_interval = scan_interval
+        self._max_scan_interval = max(scan_interval, max_scan_interval)
+        self._catalog_interval = catalog_interval
         self._is_only_check = is_only_check
 
         if hass is not None:
@@ -152,11 +223,66 @@ class LedFxUpdater(DataUpdateCoordinator):
         self.sensors: dict[str, LedFxEntityDescription] = {}
         self.switches: dict[str, LedFxEntityDescription] = {}
 
+        self.device_states: dict[str, LedFxDeviceState] = {}
+
         self.effect_properties: dict = {}
+        self.effect_index: LedFxEffectIndex = LedFxEffectIndex()
+        self._effect_list: tuple[str, ...] = ()
+        self._effect_list_sources: tuple = (None, None, None)
+        self._schema_hash: str | None = None
         self.colors: dict = {}
         self.gradients: dict = {}
+        self.color_names: dict[str, str] = {}
+        self.gradient_names: dict[str, str] = {}
+
+        self._store: Store | None = (
+            Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+            if hass is not None and entry_id is not None
+            else None
+        )
+        self._responses: dict[str, dict] = {}
+        self._received_hashes: dict[str, str] = {}
+        self._restored: dict[str, dict] | None = None
+        self._is_snapshot_dirty: bool = False
+        self._effect_writes: dict[str, LedFxEffectWrite] = {}
+
+        self.websocket: LedFxWebsocket | None = (
+            LedFxWebsocket(
+                async_get_clientsession(hass, False),
+                ip,
+                port,
+                self._async_websocket_event,
+                self._async_websocket_connection,
+                auth if isinstance(auth, tuple) else None,
+            )
+            if hass is not None and is_websocket and not is_only_check
+            else None
+        )
+
+        self.overruns: dict[str, int] = {}
+        self.refresh_statistics: dict[str, float] = {
+            STATISTIC_REFRESHES: 0,
+            STATISTIC_COALESCED_REFRESHES: 0,
+            STATISTIC_OVERRUNS: 0,
+            STATISTIC_DURATION: 0.0,
+            STATISTIC_MAX_DURATION: 0.0,
+            STATISTIC_LISTENER_CALLS: 0,
+            STATISTIC_SKIPPED_LISTENER_CALLS: 0,
+        }
+        self.last_success: dict[str, datetime] = {}
+        self.stale: set[str] = set()
 
         self._is_first_update: bool = True
+        self._is_catalog_due: bool = True
+        self._unsub_catalog: CALLBACK_TYPE | None = None
+        self._changed: set[str] = set()
+        self._changed_responses: set[str] = set()
+        self._change_set: set[str | None] | None = None
+        self._is_reached: bool = False
+        self._active_until: datetime | None = None
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+        self._follow_up: asyncio.Task | None = None
+        self._device_refreshes: dict[str, CALLBACK_TYPE] = {}
 
     async def async_stop(self) -> None:
         """Stop updater"""
@@ -174,6 +300,41 @@ class LedFxUpdater(DataUpdateCoordinator):
             if _callback is not None:
                 _callback()  # pylint: disable=not-callable
 
+        if self._unsub_catalog is not None:
+            self._unsub_catalog()
+            self._unsub_catalog = None
+
+        if self.websocket is not None:
+            await self.websocket.async_stop()
+
+        if self.hass is not None:
+            self._debounced_refresh.async_cancel()
+
+        if self._unsub_refresh:  # type: ignore
+            self._unsub_refresh()  # type: ignore
+            self._unsub_refresh = None
+
+        if self._follow_up is not None:
+            self._follow_up.cancel()
+            self._follow_up = None
+
+        for unsub in self._device_refreshes.values():
+            unsub()
+
+        self._device_refreshes = {}
+
+        for write in self._effect_writes.values():
+            if write.task is not None:
+                write.task.cancel()
+
+            write.future.cancel()
+
+        self._effect_writes = {}
+
+        # The pooled client belongs to this updater, while Home Assistant
+        # replaces aclose of the clients it creates with a warning.
+        await AsyncClient.aclose(self._http_client)
+
     @cached_property
     def _update_interval(self) -> timedelta:
         """Update interval
@@ -186,33 +347,652 @@ class LedFxUpdater(DataUpdateCoordinator):
     async def update(self) -> dict:
         """Update LedFx information.
 
+        Only one refresh runs at a time. Refreshes requested while one is
+        running share a single follow-up refresh.
+
         :return dict: dict with LedFx data.
         """
 
-        self.code = codes.OK
+        if self._follow_up is None and not self._refresh_lock.locked():
+            async with self._refresh_lock:
+                return await self._async_timed_update()
+
+        self.refresh_statistics[STATISTIC_COALESCED_REFRESHES] += 1
+
+        if self._follow_up is None:
+            self._follow_up = asyncio.get_running_loop().create_task(
+                self._async_follow_up()
+            )
+
+        return await asyncio.shield(self._follow_up)
+
+    async def _async_follow_up(self) -> dict:
+        """Run the follow-up refresh after the running one.
+
+        :return dict: dict with LedFx data.
+        """
+
+        async with self._refresh_lock:
+            self._follow_up = None
+
+            return await self._async_timed_update()
 
-        _err: LedFxError | None = None
+    async def _async_timed_update(self) -> dict:
+        """Update LedFx information and count overruns of the update interval.
+
+        :return dict: dict with LedFx data.
+        """
+
+        interval: timedelta | None = getattr(self, "update_interval", None)
+        started: float = time.monotonic()
 
         try:
-            for method in PREPARE_METHODS_V1:
-                if not self._is_only_check or method == "config":
-                    await self._async_prepare(method, self.data)
-        except LedFxConnectionError as _e:
-            _err = _e
+            return await self._async_update()
+        finally:
+            duration: float = time.monotonic() - started
+
+            self.refresh_statistics[STATISTIC_REFRESHES] += 1
+            self.refresh_statistics[STATISTIC_DURATION] = duration
+            self.refresh_statistics[STATISTIC_MAX_DURATION] = max(
+                self.refresh_statistics[STATISTIC_MAX_DURATION], duration
+            )
+
+            if interval is not None and duration > interval.total_seconds():
+                self.refresh_statistics[STATISTIC_OVERRUNS] += 1
 
-            self.code = codes.NOT_FOUND
-        except LedFxRequestError as _e:
-            _err = _e
+                _LOGGER.debug(
+                    "LedFx %s refresh took %.1f s, longer than its %s interval",
+                    self.address,
+                    duration,
+                    interval,
+                )
+
+    async def _async_update(self) -> dict:
+        """Refresh the due tiers.
+
+        :return dict: dict with LedFx data.
+        """
+
+        self.code = codes.OK
 
-            self.code = codes.FORBIDDEN
+        if self._unsub_catalog is None and not self._is_only_check:
+            self._unsub_catalog = event.async_track_time_interval(
+                self.hass,
+                self._async_catalog_due,
+                timedelta(seconds=self._catalog_interval),
+            )
+
+        if self.websocket is not None:
+            self.websocket.start()
+
+        self._changed = set()
+        self._changed_responses = set()
+
+        previous: dict = dict(self.data)
+        previous_states: dict[str, LedFxDeviceState] = {
+            code: replace(state) for code, state in self.device_states.items()
+        }
+        stale: set[str] = set(self.stale)
+        self._is_reached = False
+
+        tiers: set[RefreshTier] = {RefreshTier.STATE}
+        if self._is_catalog_due:
+            tiers.add(RefreshTier.CATALOG)
+
+        methods: dict[str, tuple] = {
+            method: dependencies
+            for method, (tier, dependencies) in PREPARE_METHODS.items()
+            if tier in tiers and (not self._is_only_check or method == "config")
+        }
+
+        errors: dict[str, LedFxError] = await self._async_prepare_all(
+            methods, self.data, DEFAULT_REFRESH_DEADLINE
+        )
+
+        for method in methods:
+            if method in errors:
+                self.stale.add(method)
+            else:
+                self.last_success[method] = utcnow()
+                self.stale.discard(method)
+
+        if errors and not self._is_reached:
+            self.code = (
+                codes.FORBIDDEN
+                if any(isinstance(_e, LedFxRequestError) for _e in errors.values())
+                else codes.NOT_FOUND
+            )
         else:
+            if errors:
+                _LOGGER.debug("LedFx %s stale data: %s", self.address, errors)
+
             if self._is_first_update:
                 self._is_first_update = False
 
+            if RefreshTier.CATALOG in tiers and not any(
+                PREPARE_METHODS[method][0] == RefreshTier.CATALOG for method in errors
+            ):
+                self._is_catalog_due = False
+
+            self._async_save_snapshot()
+
+        if not codes.is_success(self.code):
+            self._is_catalog_due = True
+
         self.data[ATTR_STATE] = codes.is_success(self.code)
 
+        self._adapt_interval()
+
+        self._change_set = self._build_change_set(previous, previous_states, stale)
+
         return self.data
 
+    def _build_change_set(
+        self,
+        previous: dict,
+        previous_states: dict[str, LedFxDeviceState],
+        stale: set[str],
+    ) -> set[str | None] | None:
+        """Build the change set of a refresh.
+
+        :param previous: dict: Data before the refresh
+        :param previous_states: dict[str, LedFxDeviceState]: Device states
+            before the refresh
+        :param stale: set[str]: Stale sources before the refresh
+        :return set[str | None] | None: Changed device codes and None for
+            global data, None if every entity may be affected
+        """
+
+        if stale != self.stale or any(
+            PREPARE_METHODS.get(name, (RefreshTier.STATE,))[0] == RefreshTier.CATALOG
+            for name in self._changed_responses
+        ):
+            return None
+
+        changes: set[str | None] = {
+            code
+            for code, state in self.device_states.items()
+            if previous_states.get(code) != state
+        }
+
+        for key in previous.keys() | self.data.keys():
+            if key in previous and key in self.data and previous[key] == self.data[key]:
+                continue
+
+            if key in SHARED_KEYS:
+                return None
+
+            changes.add(None)
+
+        return changes
+
+    def is_available(self, source: str | tuple[str, ...] | None = None) -> bool:
+        """Is LedFx available and the data of the source up to date.
+
+        :param source: str | tuple[str, ...] | None: Prepare methods the data
+            comes from
+        :return bool: Is available
+        """
+
+        sources: tuple = source if isinstance(source, tuple) else (source,)
+
+        return bool(self.data.get(ATTR_STATE, False)) and not any(
+            _source in self.stale for _source in sources
+        )
+
+    def device_state(self, device_code: str) -> LedFxDeviceState:
+        """State record of a device, kept for the lifetime of the updater.
+
+        :param device_code: str: Device code
+        :return LedFxDeviceState: Device state
+        """
+
+        if (state := self.device_states.get(device_code)) is None:
+            state = self.device_states[device_code] = LedFxDeviceState()
+
+        return state
+
+    @property
+    def effect_list(self) -> tuple[str, ...]:
+        """Effects with their presets, shared by all lights.
+
+        Rebuilt only when the effects or presets are replaced, and an equal
+        rebuild keeps the previous tuple, so lights compare it by identity.
+
+        :return tuple[str, ...]: Effect list
+        """
+
+        sources: tuple = (
+            self.data.get(ATTR_LIGHT_EFFECTS),
+            self.data.get(ATTR_LIGHT_DEFAULT_PRESETS),
+            self.data.get(ATTR_LIGHT_CUSTOM_PRESETS),
+        )
+
+        if any(
+            source is not cached
+            for source, cached in zip(sources, self._effect_list_sources)
+        ):
+            effect_list: tuple[str, ...] = build_effects(
+                sources[0] or [], sources[1] or {}, sources[2] or {}
+            )
+
+            if effect_list != self._effect_list:
+                self._effect_list = effect_list
+
+            self._effect_list_sources = sources
+
+        return self._effect_list
+
+    @property
+    def flat_data(self) -> dict[str, Any]:
+        """Data with the device states flattened to code_attribute keys.
+
+        Kept for diagnostics only.
+
+        :return dict[str, Any]: Flat data
+        """
+
+        flat: dict[str, Any] = dict(self.data)
+
+        for code, state in self.device_states.items():
+            flat |= {
+                f"{code}_{ATTR_LIGHT_STATE}": state.state,
+                f"{code}_{ATTR_LIGHT_BRIGHTNESS}": state.brightness,
+                f"{code}_{ATTR_LIGHT_EFFECT}": state.effect,
+                f"{code}_{ATTR_LIGHT_EFFECT_CONFIG}": state.effect_config,
+                f"{code}_{ATTR_LIGHT_CONFIG}": state.config,
+            }
+
+            if self.version == Version.V2:
+                flat[f"{code}_{ATTR_LIGHT_COLOR}"] = state.color
+
+        return flat
+
+    @callback
+    def async_mark_active(self) -> None:
+        """Poll quickly for a while after a user command."""
+
+        self._active_until = utcnow() + timedelta(seconds=DEFAULT_ACTIVE_PERIOD)
+
+        if (
+            self.hass is None
+            or self.update_interval == self._update_interval
+            or (self.websocket is not None and self.websocket.is_connected)
+        ):
+            return
+
+        self._set_update_interval(self._scan_interval)
+
+        if self._unsub_refresh:  # type: ignore
+            self.schedule_refresh(self.update_interval)
+
+    def _adapt_interval(self) -> None:
+        """Adapt the update interval to activity and reachability.
+
+        Polls with the scan interval while states change or shortly after a
+        user command, otherwise backs off up to the max scan interval. An
+        unreachable instance backs off faster.
+        """
+
+        if self.websocket is not None and self.websocket.is_connected:
+            self._set_update_interval(DEFAULT_WEBSOCKET_SCAN_INTERVAL)
+
+            return
+
+        interval: float = (
+            self.update_interval.total_seconds()
+            if self.update_interval is not None
+            else self._scan_interval
+        )
+
+        if self.code == codes.NOT_FOUND:
+            interval *= DEFAULT_UNREACHABLE_BACKOFF
+        elif self._changed_responses or (
+            self._active_until is not None and utcnow() < self._active_until
+        ):
+            interval = self._scan_interval
+        else:
+            interval *= DEFAULT_IDLE_BACKOFF
+
+        self._set_update_interval(
+            min(max(interval, self._scan_interval), self._max_scan_interval)
+        )
+
+    def _set_update_interval(self, seconds: float) -> None:
+        """Set update interval.
+
+        :param seconds: float: Update interval in seconds
+        """
+
+        self.update_interval = timedelta(seconds=seconds)
+        self.data[ATTR_UPDATE_INTERVAL] = round(seconds, 1)
+
+    async def async_write_effect(
+        self, device_code: str, effect: str, config: dict, changes: dict
+    ) -> None:
+        """Write effect config, coalescing the changes of one device.
+
+        Changes made within DEFAULT_WRITE_DELAY are merged into a single write.
+        A change made while a write is in flight cancels it and the merged
+        config is written again, so the latest state always wins.
+
+        :param device_code: str: Device code
+        :param effect: str: Effect code
+        :param config: dict: Current effect config
+        :param changes: dict: Changed effect parameters
+        """
+
+        write: LedFxEffectWrite | None = self._effect_writes.get(device_code)
+
+        if write is None:
+            write = self._effect_writes[device_code] = LedFxEffectWrite(
+                effect=effect,
+                config=config,
+                changes=dict(changes),
+                future=self.hass.loop.create_future(),
+            )
+        else:
+            write.effect = effect
+            write.config = config
+            write.changes |= changes
+
+        self.async_mark_active()
+
+        if write.task is None or write.is_sending:
+            if write.task is not None:
+                write.task.cancel()
+
+            write.is_sending = False
+            write.task = self.hass.async_create_task(
+                self._async_send_effect(device_code, write)
+            )
+            write.task.add_done_callback(
+                lambda task: self._async_effect_sent(device_code, write, task)
+            )
+
+        await asyncio.shield(write.future)
+
+    @callback
+    def async_schedule_device_refresh(self, device_code: str) -> None:
+        """Re-read one device shortly after a command to confirm its state.
+
+        Commands for the same device within DEFAULT_DEVICE_REFRESH_DELAY
+        share one read. Pushed events confirm commands on their own. Only
+        the V2 API returns a single device with its active effect.
+
+        :param device_code: str: Device code
+        """
+
+        if (
+            self.hass is None
+            or self.version != Version.V2
+            or (self.websocket is not None and self.websocket.is_connected)
+        ):
+            return
+
+        if unsub := self._device_refreshes.pop(device_code, None):
+            unsub()
+
+        @callback
+        def refresh(_now: datetime) -> None:
+            """Start the device refresh.
+
+            :param _now: datetime
+            """
+
+            self._device_refreshes.pop(device_code, None)
+            self.hass.async_create_task(self.async_refresh_device(device_code))
+
+        self._device_refreshes[device_code] = event.async_call_later(
+            self.hass, DEFAULT_DEVICE_REFRESH_DELAY, refresh
+        )
+
+    async def async_refresh_device(self, device_code: str) -> None:
+        """Refresh one device and update only its entities.
+
+        :param device_code: str: Device code
+        """
+
+        if self._refresh_lock.locked() or device_code not in self.devices:
+            return
+
+        try:
+            response: dict = await self.client.virtual(device_code)
+        except (LedFxConnectionError, LedFxRequestError) as _e:
+            _LOGGER.debug(
+                "LedFx %s device %s refresh error: %r", self.address, device_code, _e
+            )
+
+            return
+
+        device: dict = self._merge_virtual(
+            response[device_code],
+            self._responses.get("devices", {}).get("devices", {}),
+        )
+
+        self._build_device(self.data, {device_code: device})
+        self.async_update_device_listeners(device_code)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners affected by the last refresh.
+
+        Listeners without a context are updated on any global change, device
+        listeners only when their device changed. Everything is updated when
+        the change set is unknown.
+        """
+
+        changes, self._change_set = self._change_set, None
+
+        self._async_update_listeners(changes)
+
+    @callback
+    def async_update_device_listeners(self, device_code: str) -> None:
+        """Update the entities of one device.
+
+        :param device_code: str: Device code
+        """
+
+        self._async_update_listeners({device_code})
+
+    @callback
+    def _async_update_listeners(self, changes: set[str | None] | None) -> None:
+        """Update the listeners subscribed to the changes.
+
+        :param changes: set[str | None] | None: Changed device codes and None
+            for global data, None to update everything
+        """
+
+        for update_callback, context in list(self._listeners.values()):
+            if changes is None or context in changes:
+                self.refresh_statistics[STATISTIC_LISTENER_CALLS] += 1
+
+                update_callback()
+            else:
+                self.refresh_statistics[STATISTIC_SKIPPED_LISTENER_CALLS] += 1
+
+    async def _async_send_effect(
+        self, device_code: str, write: LedFxEffectWrite
+    ) -> None:
+        """Send the merged effect config after the write delay.
+
+        :param device_code: str: Device code
+        :param write: LedFxEffectWrite: Pending write
+        """
+
+        await asyncio.sleep(DEFAULT_WRITE_DELAY)
+
+        write.is_sending = True
+        config: dict = write.config | write.changes
+
+        await self.client.effect(
+            device_code,
+            write.effect,
+            self._convert_config(config, write.changes),
+            self.version == Version.V2,
+        )
+
+        self.device_state(device_code).effect_config = {
+            code: value for code, value in config.items() if code != ATTR_BRIGHTNESS
+        }
+
+        self.async_update_device_listeners(device_code)
+        self.async_schedule_device_refresh(device_code)
+
+    @callback
+    def _async_effect_sent(
+        self, device_code: str, write: LedFxEffectWrite, task: asyncio.Task
+    ) -> None:
+        """Resolve the waiters of a finished effect write.
+
+        :param device_code: str: Device code
+        :param write: LedFxEffectWrite: Pending write
+        :param task: asyncio.Task: Finished send task
+        """
+
+        # A write queued after the task finished but before this callback
+        # ran has started a new task, which resolves the waiters instead.
+        if task.cancelled() or task is not write.task:
+            return
+
+        if self._effect_writes.get(device_code) is write:
+            del self._effect_writes[device_code]
+
+        if task.exception() is not None:
+            write.future.set_exception(task.exception())  # type: ignore
+        else:
+            write.future.set_result(None)
+
+    def _convert_config(self, config: dict, changes: dict) -> dict:
+        """Convert color names to their values
+
+        The stored effect config holds color names, so untouched colors are
+        converted too. Changed colors with an unknown name are not sent.
+
+        :param config: dict
+        :param changes: dict
+        :return dict
+        """
+
+        result: dict = copy.deepcopy(config)
+
+        for code, value in config.items():
+            if (
+                code in self.effect_properties
+                and self.effect_properties[code][ATTR_FIELD_TYPE] == "color"
+            ):
+                if value in self.colors:
+                    result[code] = self.colors[value]
+                elif value in self.gradients:
+                    result[code] = self.gradients[value]
+                elif code in changes:
+                    del result[code]
+
+        return result
+
+    async def async_restore(self) -> bool:
+        """Restore catalog data and entity descriptions from the last snapshot.
+
+        Entities stay unavailable until the first refresh from LedFx succeeds.
+
+        :return bool: Is restored
+        """
+
+        if self._store is None:
+            return False
+
+        snapshot: dict | None = await self._store.async_load()
+
+        if not snapshot:
+            return False
+
+        self._restored = snapshot
+
+        try:
+            if errors := await self._async_prepare_all(
+                {
+                    method: dependencies
+                    for method, (_, dependencies) in PREPARE_METHODS.items()
+                },
+                self.data,
+            ):
+                raise next(iter(errors.values()))
+        except (LedFxError, KeyError, TypeError, ValueError) as _e:
+            _LOGGER.debug("Snapshot restore failed: %r", _e)
+
+            return False
+        finally:
+            self._restored = None
+
+        self._responses = dict(snapshot)
+        self._is_snapshot_dirty = False
+        self.data[ATTR_STATE] = False
+
+        return True
+
+    async def async_request_catalog_refresh(self) -> None:
+        """Request refresh including catalog data."""
+
+        self._is_catalog_due = True
+
+        await self.async_request_refresh()
+
+    @callback
+    def _async_websocket_event(self, message: dict) -> None:
+        """Apply a LedFx event to the data.
+
+        Effect changes of known devices are applied in place, other events
+        request a refresh.
+
+        :param message: dict: Event message
+        """
+
+        code: str | None = message.get("virtual_id", message.get("device_id"))
+        event_type: str | None = message.get("event_type")
+
+        if (
+            code in self.devices
+            and event_type == WebsocketEvent.EFFECT_SET.value
+            and isinstance(message.get("effect_config"), dict)
+            and "brightness" in message["effect_config"]
+        ):
+            self._build_device_effect(
+                self.data,
+                code,  # type: ignore
+                {"type": message.get("effect_id"), "config": message["effect_config"]},
+            )
+        elif code in self.devices and event_type == WebsocketEvent.EFFECT_CLEARED.value:
+            self._build_device_effect(self.data, code, None)  # type: ignore
+        else:
+            self.hass.async_create_task(self.async_request_refresh())
+
+            return
+
+        self.async_update_device_listeners(code)  # type: ignore
+
+    @callback
+    def _async_websocket_connection(self, is_connected: bool) -> None:
+        """Poll slowly while events are pushed.
+
+        :param is_connected: bool: Is websocket connected
+        """
+
+        self._set_update_interval(
+            DEFAULT_WEBSOCKET_SCAN_INTERVAL if is_connected else self._scan_interval
+        )
+
+        if is_connected:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_catalog_due(self, now: datetime) -> None:
+        """Mark catalog data as due for the next refresh.
+
+        :param now: datetime
+        """
+
+        self._is_catalog_due = True
+
     @cached_property
     def address(self) -> str:
         """Full address
@@ -254,9 +1034,97 @@ class LedFxUpdater(DataUpdateCoordinator):
             utcnow().replace(microsecond=0) + offset,
         )
 
+    async def _async_prepare_all(
+        self, methods: dict[str, tuple], data: dict, deadline: float | None = None
+    ) -> dict[str, LedFxError]:
+        """Prepare data following the dependency graph.
+
+        Each method fails on its own and keeps its last data. Methods depending
+        on a failed method that never succeeded are skipped. Methods still
+        running at the deadline are reported as overrun and cancelled together
+        with the methods waiting for them.
+
+        :param methods: dict[str, tuple]: Methods with their dependencies
+        :param data: dict
+        :param deadline: float | None: Refresh deadline in seconds
+        :return dict[str, LedFxError]: Errors of failed methods
+        """
+
+        tasks: dict[str, asyncio.Task] = {}
+        running: set[str] = set()
+        errors: dict[str, LedFxError] = {}
+
+        async def prepare(method: str, dependencies: tuple) -> None:
+            """Prepare method after its dependencies.
+
+            :param method: str
+            :param dependencies: tuple
+            """
+
+            await asyncio.gather(*(tasks[dep] for dep in dependencies if dep in tasks))
+
+            if failed := [
+                dep
+                for dep in dependencies
+                if dep in errors and dep not in self.last_success
+            ]:
+                errors[method] = errors[failed[0]]
+
+                return
+
+            running.add(method)
+
+            try:
+                await self._async_prepare(method, data)
+            except (LedFxConnectionError, LedFxRequestError) as _e:
+                errors[method] = _e
+            finally:
+                running.discard(method)
+
+        for method, dependencies in methods.items():
+            tasks[method] = asyncio.create_task(prepare(method, dependencies))
+
+        gathered: asyncio.Future = asyncio.gather(*tasks.values())
+
+        try:
+            done, _ = await asyncio.wait({gathered}, timeout=deadline)
+
+            if not done:
+                overran: list[str] = sorted(running)
+
+                for method in overran:
+                    self.overruns[method] = self.overruns.get(method, 0) + 1
+
+                _LOGGER.warning(
+                    "LedFx %s refresh exceeded its %s s deadline in: %s",
+                    self.address,
+                    deadline,
+                    ", ".join(overran),
+                )
+
+                for method, task in tasks.items():
+                    if not task.done():
+                        errors[method] = LedFxConnectionError(
+                            "Refresh deadline exceeded"
+                        )
+
+                gathered.cancel()
+            else:
+                await gathered
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+            await asyncio.gather(gathered, *tasks.values(), return_exceptions=True)
+
+        return errors
+
     async def _async_prepare(self, method: str, data: dict) -> None:
         """Prepare data.
 
+        The content hash of a response is committed only after it is applied,
+        a failed or cancelled method parses the response again next time.
+
         :param method: str
         :param data: dict
         """
@@ -264,7 +1132,79 @@ class LedFxUpdater(DataUpdateCoordinator):
         action = getattr(self, f"_async_prepare_{method}")
 
         if action is not None:
-            await action(data)
+            try:
+                await action(data)
+            except LedFxNotModified:
+                return
+            finally:
+                content_hash: str | None = self._received_hashes.pop(method, None)
+
+            if content_hash is not None:
+                self.client.commit_hash(method, content_hash)
+
+            self._changed.add(method)
+
+    async def _async_request(self, name: str, **kwargs: Any) -> dict:
+        """Request client data or replay it from the restored snapshot.
+
+        :param name: str: Client method
+        :param kwargs: Any: Client method arguments
+        :return dict: Response
+        """
+
+        if self._restored is not None:
+            if name not in self._restored:
+                raise LedFxNotModified(f"{name} is not in the snapshot")
+
+            return self._restored[name]
+
+        try:
+            response: dict = await getattr(self.client, name)(**kwargs)
+        except LedFxNotModified:
+            self._is_reached = True
+
+            raise
+
+        self._is_reached = True
+
+        if not self._is_only_check and isinstance(
+            content_hash := self.client.content_hash(name), str
+        ):
+            self._received_hashes[name] = content_hash
+
+        if response != self._responses.get(name):
+            self._changed_responses.add(name)
+
+        self._responses[name] = response
+
+        return response
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Schedule a snapshot save when catalog data or devices changed."""
+
+        if self._store is None:
+            return
+
+        if not self._is_snapshot_dirty and not any(
+            PREPARE_METHODS[method][0] == RefreshTier.CATALOG
+            for method in self._changed
+        ):
+            return
+
+        self._is_snapshot_dirty = False
+        self._store.async_delay_save(lambda: self._responses, STORAGE_SAVE_DELAY)
+
+    def _is_skippable(self, method: str) -> bool:
+        """Can an unchanged response of the method be skipped.
+
+        :param method: str
+        :return bool: True if none of its dependencies changed in this refresh
+        """
+
+        return not any(
+            dependency in self._changed for dependency in PREPARE_METHODS[method][1]
+        )
 
     async def _async_prepare_info(self, data: dict) -> None:
         """Prepare info.
@@ -275,7 +1215,7 @@ class LedFxUpdater(DataUpdateCoordinator):
         if self.version != Version.V1:
             return
 
-        response: dict = await self.client.info()
+        response: dict = await self._async_request("info")
 
         if "version" in response:
             data[ATTR_DEVICE_SW_VERSION] = response["version"]
@@ -287,9 +1227,11 @@ class LedFxUpdater(DataUpdateCoordinator):
         """
 
         if self.version != Version.V2:
-            return
+            raise LedFxNotModified("Colors are not supported")
 
-        response: dict = await self.client.colors()
+        response: dict = await self._async_request(
+            "colors", skip_unchanged=self._is_skippable("colors")
+        )
 
         colors: dict = {}
         gradients: dict = {}
@@ -307,6 +1249,8 @@ class LedFxUpdater(DataUpdateCoordinator):
 
         self.colors = colors
         self.gradients = gradients
+        self.color_names = build_reverse_index(colors)
+        self.gradient_names = build_reverse_index(gradients)
 
     async def _async_prepare_schema(self, data: dict) -> None:
         """Prepare schema.
@@ -314,27 +1258,36 @@ class LedFxUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.client.schema()
+        response: dict = await self._async_request(
+            "schema", skip_unchanged=self._is_skippable("schema")
+        )
 
         if "effects" in response and response["effects"]:
             data[ATTR_LIGHT_EFFECTS] = sorted(list(response["effects"].keys()))
 
-            for effect, fields in response["effects"].items():
-                for code, parameter in fields["schema"]["properties"].items():
-                    if code == "brightness" or (
-                        self.version == Version.V2 and code == "background_color"
-                    ):
-                        continue
+            schema_hash: str | None = (
+                self.client.content_hash("schema") if self._restored is None else None
+            )
 
-                    if code in self.effect_properties:
-                        if (
-                            effect
-                            not in self.effect_properties[code][ATTR_FIELD_EFFECTS]
-                        ):
-                            self.effect_properties[code][ATTR_FIELD_EFFECTS].append(
-                                effect
-                            )
+            if not isinstance(schema_hash, str) or schema_hash != self._schema_hash:
+                self.effect_index = LedFxEffectIndex.build(
+                    response["effects"],
+                    ("brightness", "background_color")
+                    if self.version == Version.V2
+                    else ("brightness",),
+                )
 
+            self._schema_hash = schema_hash
+
+            for code, info in self.effect_properties.items():
+                info[ATTR_FIELD_EFFECTS] = self.effect_index.effects.get(code, ())
+
+            for effect_data in response["effects"].values():
+                for code, parameter in effect_data["schema"]["properties"].items():
+                    if (
+                        code not in self.effect_index.effects
+                        or code in self.effect_properties
+                    ):
                         continue
 
                     field, field_type, options = self._build_entity(code, parameter)
@@ -344,7 +1297,7 @@ class LedFxUpdater(DataUpdateCoordinator):
                             ATTR_FIELD: field,
                             ATTR_FIELD_TYPE: field_type,
                             ATTR_FIELD_OPTIONS: options,
-                            ATTR_FIELD_EFFECTS: [effect],
+                            ATTR_FIELD_EFFECTS: self.effect_index.effects[code],
                         }
 
         if (
@@ -436,7 +1389,9 @@ class LedFxUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.client.config()
+        response: dict = await self._async_request(
+            "config", skip_unchanged=self._is_skippable("config")
+        )
 
         if "config" in response:
             await self._async_prepare_config_v1(data, response)
@@ -478,6 +1433,7 @@ class LedFxUpdater(DataUpdateCoordinator):
                             entity_registry_enabled_default=False,
                         ),
                         device_info=self.device_info,
+                        source="config",
                     )
 
                     if self.new_sensor_callback:
@@ -531,6 +1487,7 @@ class LedFxUpdater(DataUpdateCoordinator):
                             entity_registry_enabled_default=False,
                         ),
                         device_info=self.device_info,
+                        source="config",
                     )
 
                     if self.new_sensor_callback:
@@ -556,7 +1513,7 @@ class LedFxUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.client.devices()
+        response: dict = await self._async_request("devices")
 
         if "devices" not in response or not response["devices"]:  # pragma: no cover
             return
@@ -566,29 +1523,37 @@ class LedFxUpdater(DataUpdateCoordinator):
 
             return
 
-        v_response: dict = await self.client.virtuals()
+        v_response: dict = await self._async_request("virtuals")
 
         if "virtuals" in v_response and v_response["virtuals"]:
-            devices: dict = {}
-            for key, virtual in v_response["virtuals"].items():
-                devices[key] = virtual
-
-                if (
-                    virtual.get("is_device")
-                    and virtual.get("is_device", "") in response["devices"]
-                ):
-                    devices[key]["config"] |= {
-                        code: value
-                        for code, value in response["devices"][
-                            virtual.get("is_device")
-                        ]["config"].items()
-                        if code == "ip_address"
-                    }
-                    devices[key]["type"] = response["devices"][
-                        virtual.get("is_device")
-                    ]["type"]
-
-            self._build_device(data, devices)
+            self._build_device(
+                data,
+                {
+                    key: self._merge_virtual(virtual, response["devices"])
+                    for key, virtual in v_response["virtuals"].items()
+                },
+            )
+
+    @staticmethod
+    def _merge_virtual(virtual: dict, devices: dict) -> dict:
+        """Merge the address and type of its physical device into a virtual
+
+        :param virtual: dict: Virtual data
+        :param devices: dict: Physical devices
+        :return dict: Merged virtual copy
+        """
+
+        merged: dict = virtual | {"config": dict(virtual.get("config", {}))}
+
+        if virtual.get("is_device") and virtual.get("is_device", "") in devices:
+            merged["config"] |= {
+                code: value
+                for code, value in devices[virtual.get("is_device")]["config"].items()
+                if code == "ip_address"
+            }
+            merged["type"] = devices[virtual.get("is_device")]["type"]
+
+        return merged
 
     def _build_device(self, data: dict, devices: dict) -> None:
         """Build device
@@ -598,39 +1563,9 @@ class LedFxUpdater(DataUpdateCoordinator):
         """
 
         for code, device in devices.items():
-            data[f"{code}_{ATTR_LIGHT_STATE}"] = bool(
-                "effect" in device and device["effect"]
-            )
-
-            if data[f"{code}_{ATTR_LIGHT_STATE}"]:
-                data |= {
-                    f"{code}_{ATTR_LIGHT_BRIGHTNESS}": convert_brightness(
-                        float(device["effect"]["config"]["brightness"]), True
-                    ),
-                    f"{code}_{ATTR_LIGHT_EFFECT}": device["effect"].get("type"),
-                    f"{code}_{ATTR_LIGHT_EFFECT_CONFIG}": self._convert_effect_config(
-                        device["effect"]["config"]
-                    ),
-                }
-            else:
-                data |= {
-                    f"{code}_{ATTR_LIGHT_BRIGHTNESS}": 0,
-                    f"{code}_{ATTR_LIGHT_EFFECT}": data.get(ATTR_LIGHT_EFFECTS, ["-"])[
-                        0
-                    ],
-                    f"{code}_{ATTR_LIGHT_EFFECT_CONFIG}": {},
-                }
-
-            if self.version == Version.V2:
-                data |= {
-                    f"{code}_{ATTR_LIGHT_COLOR}": device["effect"]["config"].get(
-                        "background_color"
-                    )
-                    if data[f"{code}_{ATTR_LIGHT_STATE}"]
-                    else None
-                }
+            self._build_device_effect(data, code, device.get("effect"))
 
-            data[f"{code}_{ATTR_LIGHT_CONFIG}"] = {
+            self.device_state(code).config = {
                 config: value
                 for config, value in device.get("config", {}).items()
                 if config not in ["icon_name", "name"]
@@ -653,6 +1588,8 @@ class LedFxUpdater(DataUpdateCoordinator):
 
             icon: str = device_config.get("icon_name", "")
 
+            self._is_snapshot_dirty = True
+
             self.devices[code] = LedFxEntityDescription(
                 description=LightEntityDescription(
                     key=code,
@@ -662,31 +1599,62 @@ class LedFxUpdater(DataUpdateCoordinator):
                 ),
                 type=ActionType.DEVICE,
                 device_info=device_info,
+                source="devices",
             )
 
             if self.new_device_callback:
                 async_dispatcher_send(self.hass, SIGNAL_NEW_DEVICE, self.devices[code])
 
+    def _build_device_effect(self, data: dict, code: str, effect: dict | None) -> None:
+        """Build device effect state
+
+        :param data: dict
+        :param code: str: Device code
+        :param effect: dict | None: Active effect
+        """
+
+        state: LedFxDeviceState = self.device_state(code)
+        state.state = bool(effect)
+
+        if effect:
+            if effect.get("type") not in data.get(ATTR_LIGHT_EFFECTS, []):
+                self._is_catalog_due = True
+
+            state.brightness = convert_brightness(
+                float(effect["config"]["brightness"]), True
+            )
+            state.effect = effect.get("type")
+            state.effect_config = self._convert_effect_config(effect["config"])
+        else:
+            state.brightness = 0
+            state.effect = data.get(ATTR_LIGHT_EFFECTS, ["-"])[0]
+            state.effect_config = {}
+
+        if self.version == Version.V2:
+            state.color = effect["config"].get("background_color") if effect else None
+
     def _convert_effect_config(self, config: dict) -> dict:
-        """Convert effect config
+        """Convert effect config, the response config is left unchanged
 
         :param config: dict
-        :return dict
+        :return dict: Converted copy
         """
 
+        converted: dict = dict(config)
+
         for code, value in config.items():
             if (
-                code in self.effect_properties
+                isinstance(value, str)
+                and code in self.effect_properties
                 and self.effect_properties[code][ATTR_FIELD_TYPE] == "color"
+                and (
+                    name := self.color_names.get(value, self.gradient_names.get(value))
+                )
+                is not None
             ):
-                colors = self.colors if value in self.colors else self.gradients
-                for name, color in colors.items():
-                    if color == value:
-                        config[code] = name
-
-                        break
+                converted[code] = name
 
-        return config
+        return converted
 
     def _prepare_device_fields(self, code: str, device_info: DeviceInfo) -> None:
         """Prepare device fields
@@ -708,8 +1676,8 @@ class LedFxUpdater(DataUpdateCoordinator):
                     type=ActionType.DEVICE,
                     device_info=device_info,
                     device_code=code,
+                    source="devices",
                     extra={
-                        ATTR_FIELD_EFFECTS: sorted(info.get(ATTR_FIELD_EFFECTS, {})),
                         ATTR_FIELD_TYPE: info.get(ATTR_FIELD_TYPE),
                     },
                 )
@@ -725,8 +1693,8 @@ class LedFxUpdater(DataUpdateCoordinator):
                     type=ActionType.DEVICE,
                     device_info=device_info,
                     device_code=code,
+                    source="devices",
                     extra={
-                        ATTR_FIELD_EFFECTS: sorted(info.get(ATTR_FIELD_EFFECTS, {})),
                         ATTR_FIELD_TYPE: info.get(ATTR_FIELD_TYPE),
                     },
                 )
@@ -742,8 +1710,8 @@ class LedFxUpdater(DataUpdateCoordinator):
                     type=ActionType.DEVICE,
                     device_info=device_info,
                     device_code=code,
+                    source="devices",
                     extra={
-                        ATTR_FIELD_EFFECTS: sorted(info.get(ATTR_FIELD_EFFECTS, [])),
                         ATTR_FIELD_OPTIONS: sorted(info.get(ATTR_FIELD_OPTIONS, [])),
                         ATTR_FIELD_TYPE: info.get(ATTR_FIELD_TYPE),
                     },
@@ -768,7 +1736,7 @@ class LedFxUpdater(DataUpdateCoordinator):
         if self.version != Version.V1:
             return
 
-        response: dict = await self.client.audio_devices()
+        response: dict = await self._async_request("audio_devices")
 
         if "devices" in response:
             data[ATTR_SELECT_AUDIO_INPUT_OPTIONS] = dict(response["devices"])
@@ -779,7 +1747,7 @@ class LedFxUpdater(DataUpdateCoordinator):
         :param data: dict
         """
 
-        response: dict = await self.client.scenes()
+        response: dict = await self._async_request("scenes")
 
         if "scenes" in response and response["scenes"]:
             for code, scene in response["scenes"].items():
@@ -795,6 +1763,7 @@ class LedFxUpdater(DataUpdateCoordinator):
                     ),
                     type=ActionType.SCENE,
                     device_info=self.device_info,
+                    source="scenes",
                 )
 
                 if self.new_button_callback:
@@ -812,6 +1781,121 @@ class LedFxEntityDescription:
     device_code: str | None = None
     type: ActionType = ActionType.DEFAULT
     extra: dict | None = None
+    source: str | tuple[str, ...] | None = None
+
+
+@dataclass(slots=True)
+class LedFxDeviceState:
+    """LedFx device state."""
+
+    state: bool = False
+    brightness: float = 0
+    effect: str | None = None
+    effect_config: dict = dataclasses.field(default_factory=dict)
+    config: dict = dataclasses.field(default_factory=dict)
+    color: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LedFxEffectIndex:
+    """Effect and property index of one schema version."""
+
+    properties: Mapping[str, frozenset[str]] = dataclasses.field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    effects: Mapping[str, tuple[str, ...]] = dataclasses.field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def build(cls, effects: dict, skip: tuple[str, ...] = ()) -> LedFxEffectIndex:
+        """Build the index from the effects of a schema
+
+        :param effects: dict: Schema effects
+        :param skip: tuple[str, ...]: Properties left out of the index
+        :return LedFxEffectIndex
+        """
+
+        properties: dict[str, frozenset[str]] = {
+            effect: frozenset(effect_data["schema"]["properties"]).difference(skip)
+            for effect, effect_data in effects.items()
+        }
+
+        by_property: dict[str, list[str]] = {}
+
+        for effect in sorted(properties):
+            for prop in properties[effect]:
+                by_property.setdefault(prop, []).append(effect)
+
+        return cls(
+            MappingProxyType(properties),
+            MappingProxyType(
+                {prop: tuple(_effects) for prop, _effects in by_property.items()}
+            ),
+        )
+
+    def supports(self, effect: str | None, prop: str) -> bool:
+        """Does the effect have the property
+
+        :param effect: str | None: Effect code
+        :param prop: str: Property code
+        :return bool
+        """
+
+        return effect is not None and prop in self.properties.get(effect, ())
+
+
+@dataclass
+class LedFxEffectWrite:
+    """LedFx pending effect write."""
+
+    effect: str
+    config: dict
+    changes: dict
+    future: asyncio.Future
+    task: asyncio.Task | None = None
+    is_sending: bool = False
+
+
+def build_effects(
+    effects: list, default_presets: dict[str, list], custom_presets: dict[str, list]
+) -> tuple[str, ...]:
+    """Build effects with their presets
+
+    :param effects: list: Effects list
+    :param default_presets: dict[str, list]: Default presets list
+    :param custom_presets: dict[str, list]: Custom presets list
+    :return tuple[str, ...]
+    """
+
+    full_effects: list = []
+
+    for effect in effects:
+        full_effects.append(effect)
+        full_effects += [
+            f"{effect} - {preset}" for preset in default_presets.get(effect, [])
+        ]
+        full_effects += [
+            f"{effect} - {preset}" for preset in custom_presets.get(effect, [])
+        ]
+
+    return tuple(full_effects)
+
+
+def build_reverse_index(values: dict) -> dict[str, str]:
+    """Build a value to name index, the first name of a value wins
+
+    :param values: dict: Names with their values
+    :return dict[str, str]
+    """
+
+    index: dict[str, str] = {}
+
+    for name, value in values.items():
+        if isinstance(value, str):
+            index.setdefault(value, name)
+
+    return index
 
 
 def convert_brightness(brightness: float, is_reverse: bool = False) -> float:
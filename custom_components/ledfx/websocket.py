@@ -0,0 +1,153 @@
+"""LedFx websocket client."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from aiohttp import BasicAuth, ClientError, ClientSession, WSMsgType
+
+from .const import (
+    DEFAULT_WEBSOCKET_BACKOFF,
+    DEFAULT_WEBSOCKET_HEARTBEAT,
+    DEFAULT_WEBSOCKET_MAX_BACKOFF,
+    DEFAULT_WEBSOCKET_STABLE_TIME,
+    WEBSOCKET_URL,
+)
+from .enum import WebsocketEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes
+class LedFxWebsocket:
+    """LedFx websocket client."""
+
+    ip: str  # pylint: disable=invalid-name
+    port: str
+
+    _session: ClientSession
+    _auth: BasicAuth | None = None
+
+    _url: str
+
+    def __init__(
+        self,
+        session: ClientSession,
+        ip: str,  # pylint: disable=invalid-name
+        port: str,
+        on_event: Callable[[dict], None],
+        on_connection: Callable[[bool], None],
+        auth: Any = None,
+    ) -> None:
+        """Initialize websocket client.
+
+        :param session: ClientSession: ClientSession object
+        :param ip: str: ip address
+        :param port: str: port
+        :param on_event: Callable[[dict], None]: Event callback
+        :param on_connection: Callable[[bool], None]: Connection state callback
+        :param auth: Any: Basic auth data
+        """
+
+        ip = ip.removesuffix("/")
+        self._session = session
+        self.ip = ip  # pylint: disable=invalid-name
+        self.port = port
+
+        if isinstance(auth, tuple):
+            self._auth = BasicAuth(*auth)
+
+        self._on_event = on_event
+        self._on_connection = on_connection
+
+        self._url = WEBSOCKET_URL.format(ip=ip, port=port)
+
+        self.is_connected: bool = False
+        self.reconnects: int = 0
+
+        self._connected_at: float | None = None
+
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the connection loop."""
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop the connection loop."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def _async_run(self) -> None:
+        """Connect and reconnect with an exponential backoff.
+
+        The backoff is reset only after a connection stayed up long enough,
+        a server closing every connection right away is not hammered.
+        """
+
+        backoff: float = DEFAULT_WEBSOCKET_BACKOFF
+
+        while True:
+            try:
+                await self._async_listen()
+            except (ClientError, asyncio.TimeoutError, ValueError) as _e:
+                _LOGGER.debug("Websocket error (%s): %r", self._url, _e)
+            finally:
+                if self.is_connected:
+                    self.is_connected = False
+                    self._on_connection(False)
+
+            if (
+                self._connected_at is not None
+                and time.monotonic() - self._connected_at
+                >= DEFAULT_WEBSOCKET_STABLE_TIME
+            ):
+                backoff = DEFAULT_WEBSOCKET_BACKOFF
+
+            self._connected_at = None
+
+            self.reconnects += 1
+
+            await asyncio.sleep(backoff)
+
+            backoff = min(backoff * 2, DEFAULT_WEBSOCKET_MAX_BACKOFF)
+
+    async def _async_listen(self) -> None:
+        """Subscribe to LedFx events and dispatch them until disconnected."""
+
+        async with self._session.ws_connect(
+            self._url, auth=self._auth, heartbeat=DEFAULT_WEBSOCKET_HEARTBEAT
+        ) as websocket:
+            for _id, event in enumerate(WebsocketEvent, start=1):
+                await websocket.send_json(
+                    {"id": _id, "type": "subscribe_event", "event_type": event.value}
+                )
+
+            self.is_connected = True
+            self._connected_at = time.monotonic()
+            self._on_connection(True)
+
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    break
+
+                data: dict = message.json()
+
+                if data.get("type") == "event":
+                    self._on_event(data)
@@ -26,7 +26,7 @@ from pytest_homeassistant_custom_component.common import (
 from custom_components.ledfx.const import (
     ATTR_STATE_NAME,
     ATTRIBUTION,
-    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_CATALOG_INTERVAL,
     DOMAIN,
     UPDATER,
 )
@@ -117,7 +117,32 @@ async def test_update_state(hass: HomeAssistant) -> None:
         assert entry.entity_category == EntityCategory.DIAGNOSTIC
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_ON
+        assert not updater.is_available("info")
+
+        for method in (
+            "info",
+            "colors",
+            "schema",
+            "config",
+            "devices",
+            "virtuals",
+            "audio_devices",
+            "scenes",
+        ):
+            setattr(
+                mock_client.return_value,
+                method,
+                AsyncMock(side_effect=LedFxRequestError),
+            )
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL * 2 + 2)
         )
         await hass.async_block_till_done()
 
@@ -24,6 +24,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -160,7 +161,7 @@ async def test_new_scene(hass: HomeAssistant) -> None:
         assert entry is None
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
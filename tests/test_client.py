@@ -4,18 +4,53 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
+from contextlib import suppress
+from unittest.mock import MagicMock, patch
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.httpx_client import get_async_client
-from httpx import Request
+from httpx import (
+    AsyncClient,
+    ConnectError,
+    Limits,
+    ReadTimeout,
+    Request,
+    Response,
+)
 from pytest_homeassistant_custom_component.common import load_fixture
 from pytest_httpx import HTTPXMock
 
 from custom_components.ledfx.client import LedFxClient
-from custom_components.ledfx.enum import Method
+from custom_components.ledfx.const import (
+    DEFAULT_CIRCUIT_FAILURES,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_POOL_TIMEOUT,
+    DEFAULT_POST_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    DIAGNOSTIC_CONTENT,
+    DIAGNOSTIC_STATE,
+    DIAGNOSTIC_TRANSITIONS,
+    STATISTIC_COALESCED_REQUESTS,
+    STATISTIC_CONNECTIONS_NEW,
+    STATISTIC_CONNECTIONS_REUSED,
+    STATISTIC_MAX_WAIT_TIME,
+    STATISTIC_REQUESTS,
+    STATISTIC_THROTTLED,
+    STATISTIC_UNCHANGED_RESPONSES,
+)
+from custom_components.ledfx.enum import CircuitState, Method
+from custom_components.ledfx.exceptions import (
+    LedFxConnectionError,
+    LedFxNotModified,
+)
 from tests.setup import MOCK_DEVICE, MOCK_IP_ADDRESS, MOCK_PORT, get_url
 
 _LOGGER = logging.getLogger(__name__)
@@ -115,6 +150,260 @@ async def test_schema(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert request.method == Method.GET
 
 
+@pytest.mark.asyncio
+async def test_schema_not_modified(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """schema not modified test"""
+
+    httpx_mock.add_response(text=load_fixture("schema_data.json"), method=Method.GET)
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT
+    )
+
+    assert client.content_hash("schema") is None
+    assert await client.schema(skip_unchanged=True) == json.loads(
+        load_fixture("schema_data.json")
+    )
+
+    schema_hash: str | None = client.content_hash("schema")
+    assert schema_hash is not None
+
+    assert await client.schema(skip_unchanged=True) == json.loads(
+        load_fixture("schema_data.json")
+    )
+
+    client.commit_hash("schema", schema_hash)
+
+    with pytest.raises(LedFxNotModified):
+        await client.schema(skip_unchanged=True)
+
+    assert client.content_hash("schema") == schema_hash
+
+    assert await client.schema() == json.loads(load_fixture("schema_data.json"))
+    assert client.statistics[STATISTIC_UNCHANGED_RESPONSES] == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_single_decode(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """schema single decode test"""
+
+    httpx_mock.add_response(text=load_fixture("schema_data.json"), method=Method.GET)
+
+    schema: dict = json.loads(load_fixture("schema_data.json"))
+    mock_loads: MagicMock = MagicMock(wraps=json.loads)
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False),
+        f"{MOCK_IP_ADDRESS}/",
+        MOCK_PORT,
+        loads=mock_loads,
+    )
+
+    assert await client.schema() == schema
+    assert mock_loads.call_count == 1
+
+    assert client.diagnostics["schema"][DIAGNOSTIC_CONTENT] == schema
+    assert mock_loads.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_coalesced(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """schema coalesced test"""
+
+    httpx_mock.add_response(text=load_fixture("schema_data.json"), method=Method.GET)
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT, retries=0
+    )
+
+    first, second = await asyncio.gather(client.schema(), client.schema())
+
+    assert first is second
+    assert first == json.loads(load_fixture("schema_data.json"))
+    assert len(httpx_mock.get_requests()) == 1
+    assert client.statistics[STATISTIC_COALESCED_REQUESTS] == 1
+
+    httpx_mock.add_exception(ConnectError("Connection error"))
+
+    results: list = await asyncio.gather(
+        client.devices(), client.devices(), return_exceptions=True
+    )
+
+    assert all(isinstance(result, LedFxConnectionError) for result in results)
+    assert len(httpx_mock.get_requests()) == 2
+    assert client.statistics[STATISTIC_COALESCED_REQUESTS] == 2
+
+
+@pytest.mark.asyncio
+async def test_request_cancelled(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """shared request cancelled with its last caller test"""
+
+    started: asyncio.Event = asyncio.Event()
+    cancelled: asyncio.Event = asyncio.Event()
+
+    async def slow_schema(request: Request) -> Response:
+        started.set()
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+
+            raise
+
+        return Response(200, text=load_fixture("schema_data.json"))  # pragma: no cover
+
+    httpx_mock.add_callback(slow_schema, url=get_url("schema"))
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT, retries=0
+    )
+
+    first: asyncio.Task = asyncio.create_task(client.schema())
+    second: asyncio.Task = asyncio.create_task(client.schema())
+
+    await asyncio.wait_for(started.wait(), 1)
+
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await asyncio.sleep(0)
+
+    assert not cancelled.is_set()
+
+    second.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+
+    assert client._in_flight == {}
+    assert sum(client.scheduler._active.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """circuit breaker test"""
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT, retries=0
+    )
+
+    for _ in range(DEFAULT_CIRCUIT_FAILURES):
+        httpx_mock.add_exception(ConnectError("Connection error"))
+
+        with pytest.raises(LedFxConnectionError):
+            await client.config()
+
+    assert client.circuit == CircuitState.OPEN
+
+    with pytest.raises(LedFxConnectionError):
+        await client.device_off(MOCK_DEVICE)
+
+    assert len(httpx_mock.get_requests()) == DEFAULT_CIRCUIT_FAILURES
+
+    with patch("custom_components.ledfx.client.DEFAULT_CIRCUIT_RESET_TIMEOUT", 0):
+        httpx_mock.add_exception(ConnectError("Connection error"))
+
+        with pytest.raises(LedFxConnectionError):
+            await client.config()
+
+        assert client.circuit == CircuitState.OPEN
+
+        httpx_mock.add_response(
+            text=load_fixture("info_data.json"), url=get_url("info")
+        )
+        httpx_mock.add_response(
+            text=load_fixture("config_data.json"), url=get_url("config")
+        )
+
+        assert await client.config() == json.loads(load_fixture("config_data.json"))
+
+    assert client.circuit == CircuitState.CLOSED
+    assert [
+        transition[DIAGNOSTIC_STATE]
+        for transition in client.circuit_diagnostics[DIAGNOSTIC_TRANSITIONS]
+    ] == ["open", "half_open", "open", "half_open", "closed"]
+
+    requests: list[Request] = httpx_mock.get_requests()
+    assert [request.url for request in requests[DEFAULT_CIRCUIT_FAILURES:]] == [
+        get_url("info"),
+        get_url("info"),
+        get_url("config"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_retry(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """request retry test"""
+
+    httpx_mock.add_exception(ConnectError("Connection error"), url=get_url("devices"))
+    httpx_mock.add_response(
+        text=load_fixture("devices_data.json"), url=get_url("devices")
+    )
+    httpx_mock.add_exception(
+        ConnectError("Connection error"), url=get_url(f"devices/{MOCK_DEVICE}/effects")
+    )
+    httpx_mock.add_exception(ReadTimeout("Read timeout"), url=get_url("schema"))
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT
+    )
+
+    with patch("custom_components.ledfx.client.DEFAULT_RETRY_BACKOFF", 0):
+        assert await client.devices() == json.loads(load_fixture("devices_data.json"))
+
+        with pytest.raises(LedFxConnectionError):
+            await client.device_off(MOCK_DEVICE)
+
+        with pytest.raises(LedFxConnectionError):
+            await client.schema()
+
+    assert client.retries == {"devices": 1}
+    assert len(httpx_mock.get_requests()) == 4
+
+
+@pytest.mark.asyncio
+async def test_request_timeouts(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """request timeouts test"""
+
+    httpx_mock.add_response(
+        text=load_fixture("schema_data.json"), url=get_url("schema")
+    )
+    httpx_mock.add_response(
+        text=load_fixture("devices_data.json"), url=get_url("devices")
+    )
+    httpx_mock.add_response(
+        text='{"status": "success"}', url=get_url(f"virtuals/{MOCK_DEVICE}/effects")
+    )
+    httpx_mock.add_response(text='{"status": "success"}', url=get_url("scenes"))
+    httpx_mock.add_response(
+        text='{"status": "success"}', url=get_url("config"), method=Method.PUT
+    )
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT
+    )
+
+    await client.schema()
+    await client.devices()
+    await client.device_off(MOCK_DEVICE, True)
+    await client.run_scene("test")
+    await client.set_audio_device(1, True)
+
+    assert [
+        request.extensions["timeout"]["read"] for request in httpx_mock.get_requests()
+    ] == [30, DEFAULT_TIMEOUT, 5, DEFAULT_POST_TIMEOUT, DEFAULT_POST_TIMEOUT]
+
+    for request in httpx_mock.get_requests():
+        assert request.extensions["timeout"]["connect"] == DEFAULT_CONNECT_TIMEOUT
+        assert request.extensions["timeout"]["pool"] == DEFAULT_POOL_TIMEOUT
+
+
 @pytest.mark.asyncio
 async def test_config(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     """config test"""
@@ -152,13 +441,39 @@ async def test_device_on(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.POST)
     assert request is not None
     assert request.url == get_url(f"devices/{MOCK_DEVICE}/effects")
-    assert (
-        request.content
-        == b'{"config": {"active": true}, "type": "wavelength(Reactive)"}'
-    )
+    assert json.loads(request.content) == {
+        "config": {"active": True},
+        "type": "wavelength(Reactive)",
+    }
     assert request.method == Method.POST
 
 
+@pytest.mark.asyncio
+async def test_device_on_with_config(
+    hass: HomeAssistant, httpx_mock: HTTPXMock
+) -> None:
+    """device on with config test"""
+
+    httpx_mock.add_response(
+        text=load_fixture("device_on_data.json"), method=Method.POST
+    )
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT
+    )
+
+    assert await client.device_on(
+        MOCK_DEVICE, "wavelength(Reactive)", config={"brightness": 0.5}
+    ) == json.loads(load_fixture("device_on_data.json"))
+
+    request: Request | None = httpx_mock.get_request(method=Method.POST)
+    assert request is not None
+    assert json.loads(request.content) == {
+        "config": {"active": True, "brightness": 0.5},
+        "type": "wavelength(Reactive)",
+    }
+
+
 @pytest.mark.asyncio
 async def test_device_off(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     """device off test"""
@@ -198,10 +513,11 @@ async def test_preset(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url(f"devices/{MOCK_DEVICE}/presets")
-    assert (
-        request.content
-        == b'{"category": "default_presets", "effect_id": "wavelength(Reactive)", "preset_id": "sunset-sweep"}'
-    )
+    assert json.loads(request.content) == {
+        "category": "default_presets",
+        "effect_id": "wavelength(Reactive)",
+        "preset_id": "sunset-sweep",
+    }
     assert request.method == Method.PUT
 
 
@@ -233,10 +549,19 @@ async def test_effect(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url(f"devices/{MOCK_DEVICE}/effects")
-    assert (
-        request.content
-        == b'{"config": {"blur": 8.587469069357562, "brightness": 1, "flip": true, "gradient_name": "Sunset", "gradient_roll": 4, "mirror": false, "gradient_repeat": 1, "background_color": "white"}, "type": "wavelength(Reactive)"}'
-    )
+    assert json.loads(request.content) == {
+        "config": {
+            "blur": 8.587469069357562,
+            "brightness": 1,
+            "flip": True,
+            "gradient_name": "Sunset",
+            "gradient_roll": 4,
+            "mirror": False,
+            "gradient_repeat": 1,
+            "background_color": "white",
+        },
+        "type": "wavelength(Reactive)",
+    }
     assert request.method == Method.PUT
 
 
@@ -259,7 +584,7 @@ async def test_set_audio_device(hass: HomeAssistant, httpx_mock: HTTPXMock) -> N
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url("audio/devices")
-    assert request.content == b'{"index": 0}'
+    assert json.loads(request.content) == {"index": 0}
     assert request.method == Method.PUT
 
 
@@ -280,5 +605,89 @@ async def test_run_scene(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url("scenes")
-    assert request.content == b'{"action": "activate", "id": "test"}'
+    assert json.loads(request.content) == {"action": "activate", "id": "test"}
     assert request.method == Method.PUT
+
+
+@pytest.mark.asyncio
+async def test_connection_reuse(hass: HomeAssistant, socket_enabled) -> None:
+    """connection reuse test"""
+
+    async def info(request: web.Request) -> web.Response:
+        return web.Response(
+            text=load_fixture("info_data.json"), content_type="application/json"
+        )
+
+    app: web.Application = web.Application()
+    app.router.add_get("/api/info", info)
+
+    async with TestServer(app, host="127.0.0.1") as server, AsyncClient(
+        limits=Limits(keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY)
+    ) as http_client:
+        client: LedFxClient = LedFxClient(http_client, server.host, str(server.port))
+
+        assert await client.info() == json.loads(load_fixture("info_data.json"))
+        assert await client.info() == json.loads(load_fixture("info_data.json"))
+
+    assert client.statistics[STATISTIC_CONNECTIONS_NEW] == 1
+    assert client.statistics[STATISTIC_CONNECTIONS_REUSED] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_limits(hass: HomeAssistant, socket_enabled) -> None:
+    """requests in flight and rate limit test against a stand-in server"""
+
+    in_flight: list[int] = [0, 0]
+    is_full: asyncio.Event = asyncio.Event()
+
+    async def device(request: web.Request) -> web.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+
+        if in_flight[0] == 2:
+            is_full.set()
+
+        # The first requests wait for each other, the peak does not depend
+        # on how quickly a loaded machine starts them.
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(is_full.wait(), 1)
+
+        await asyncio.sleep(0.02)
+
+        in_flight[0] -= 1
+
+        return web.json_response({"status": "success"})
+
+    app: web.Application = web.Application()
+    app.router.add_get("/api/devices/{device}", device)
+
+    async with TestServer(
+        app, host="127.0.0.1"
+    ) as server, AsyncClient() as http_client:
+        client: LedFxClient = LedFxClient(
+            http_client,
+            server.host,
+            str(server.port),
+            max_concurrent_requests=2,
+            rate_limit=20,
+            rate_burst=2,
+        )
+
+        started: float = time.monotonic()
+
+        await asyncio.gather(*(client.request(f"devices/{_id}") for _id in range(12)))
+
+        elapsed: float = time.monotonic() - started
+
+    statistics: dict = client.scheduler.statistics["state"]
+
+    _LOGGER.debug(
+        "12 requests in %.3f s, max wait %.3f s",
+        elapsed,
+        statistics[STATISTIC_MAX_WAIT_TIME],
+    )
+
+    assert in_flight[1] == 2
+    assert elapsed >= 10 / 20
+    assert statistics[STATISTIC_REQUESTS] == 12
+    assert statistics[STATISTIC_THROTTLED] > 0
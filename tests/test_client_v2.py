@@ -131,6 +131,24 @@ async def test_virtuals(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert request.method == Method.GET
 
 
+@pytest.mark.asyncio
+async def test_virtual(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """single virtual test"""
+
+    httpx_mock.add_response(text=load_fixture("virtual_data.json"), method=Method.GET)
+
+    client: LedFxClient = LedFxClient(
+        get_async_client(hass, False), f"{MOCK_IP_ADDRESS}/", MOCK_PORT
+    )
+
+    assert await client.virtual("wled") == json.loads(load_fixture("virtual_data.json"))
+
+    request: Request | None = httpx_mock.get_request(method=Method.GET)
+    assert request is not None
+    assert request.url == get_url("virtuals/wled")
+    assert request.method == Method.GET
+
+
 @pytest.mark.asyncio
 async def test_device_on(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     """device on test"""
@@ -150,10 +168,10 @@ async def test_device_on(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.POST)
     assert request is not None
     assert request.url == get_url(f"virtuals/{MOCK_DEVICE}/effects")
-    assert (
-        request.content
-        == b'{"config": {"active": true}, "type": "wavelength(Reactive)"}'
-    )
+    assert json.loads(request.content) == {
+        "config": {"active": True},
+        "type": "wavelength(Reactive)",
+    }
     assert request.method == Method.POST
 
 
@@ -196,10 +214,11 @@ async def test_preset(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url(f"virtuals/{MOCK_DEVICE}/presets")
-    assert (
-        request.content
-        == b'{"category": "default_presets", "effect_id": "wavelength(Reactive)", "preset_id": "sunset-sweep"}'
-    )
+    assert json.loads(request.content) == {
+        "category": "default_presets",
+        "effect_id": "wavelength(Reactive)",
+        "preset_id": "sunset-sweep",
+    }
     assert request.method == Method.PUT
 
 
@@ -232,10 +251,19 @@ async def test_effect(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url(f"virtuals/{MOCK_DEVICE}/effects")
-    assert (
-        request.content
-        == b'{"config": {"blur": 8.587469069357562, "brightness": 1, "flip": true, "gradient_name": "Sunset", "gradient_roll": 4, "mirror": false, "gradient_repeat": 1, "background_color": "white"}, "type": "wavelength(Reactive)"}'
-    )
+    assert json.loads(request.content) == {
+        "config": {
+            "blur": 8.587469069357562,
+            "brightness": 1,
+            "flip": True,
+            "gradient_name": "Sunset",
+            "gradient_roll": 4,
+            "mirror": False,
+            "gradient_repeat": 1,
+            "background_color": "white",
+        },
+        "type": "wavelength(Reactive)",
+    }
     assert request.method == Method.PUT
 
 
@@ -258,7 +286,7 @@ async def test_set_audio_device(hass: HomeAssistant, httpx_mock: HTTPXMock) -> N
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url("config")
-    assert request.content == b'{"audio": {"audio_device": 0}}'
+    assert json.loads(request.content) == {"audio": {"audio_device": 0}}
     assert request.method == Method.PUT
 
 
@@ -279,5 +307,5 @@ async def test_run_scene(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     request: Request | None = httpx_mock.get_request(method=Method.PUT)
     assert request is not None
     assert request.url == get_url("scenes")
-    assert request.content == b'{"action": "activate", "id": "test"}'
+    assert json.loads(request.content) == {"action": "activate", "id": "test"}
     assert request.method == Method.PUT
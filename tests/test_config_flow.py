@@ -24,6 +24,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry, load_f
 
 from custom_components.ledfx.const import (
     CONF_BASIC_AUTH,
+    CONF_WEBSOCKET,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TIMEOUT,
     DOMAIN,
@@ -88,6 +89,7 @@ async def test_user(hass: HomeAssistant) -> None:
     assert not result_configure["data"][CONF_BASIC_AUTH]
     assert result_configure["data"][CONF_SCAN_INTERVAL] == DEFAULT_SCAN_INTERVAL
     assert result_configure["data"][CONF_TIMEOUT] == DEFAULT_TIMEOUT
+    assert not result_configure["data"][CONF_WEBSOCKET]
 
     assert len(mock_client.mock_calls) == 2
     assert len(mock_async_setup_entry.mock_calls) == 1
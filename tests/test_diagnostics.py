@@ -77,10 +77,22 @@ async def test_init(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert diagnostics_data["config_entry"] == async_redact_data(
         config_entry.as_dict(), TO_REDACT
     )
-    assert diagnostics_data["data"] == async_redact_data(updater.data, TO_REDACT)
+    assert diagnostics_data["data"]["wled_state"]
+    assert diagnostics_data["data"]["wled_brightness"] == 255
+    assert diagnostics_data["data"]["wled_effect"] == "gradient"
+    assert diagnostics_data["data"]["wled_effect_config"]["gradient_name"] == "Rainbow"
+    assert diagnostics_data["data"]["wled_effect_config"]["speed"] == 1.0
+    assert diagnostics_data["data"]["wled_config"]["pixel_count"] == 100
+    assert not diagnostics_data["data"]["ambi_state"]
+    assert diagnostics_data["data"]["ambi_brightness"] == 0
+    assert diagnostics_data["data"]["ambi_effect_config"] == {}
+    assert "wled_color" not in diagnostics_data["data"]
     assert diagnostics_data["requests"] == async_redact_data(
         updater.client.diagnostics, TO_REDACT
     )
+    assert diagnostics_data["circuit"] == updater.client.circuit_diagnostics
+    assert diagnostics_data["scheduler"] == updater.client.scheduler.statistics
+    assert diagnostics_data["refresh"] == updater.refresh_statistics
     assert diagnostics_data["buttons"] == ["test"]
     assert diagnostics_data["devices"] == ["wled", "ambi", "garland-2"]
     assert diagnostics_data["numbers"] == [
@@ -81,7 +81,7 @@ async def test_init(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
     assert diagnostics_data["config_entry"] == async_redact_data(
         config_entry.as_dict(), TO_REDACT
     )
-    assert diagnostics_data["data"] == async_redact_data(updater.data, TO_REDACT)
+    assert diagnostics_data["data"] == async_redact_data(updater.flat_data, TO_REDACT)
     assert diagnostics_data["requests"] == async_redact_data(
         updater.client.diagnostics, TO_REDACT
     )
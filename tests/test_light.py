@@ -181,7 +181,7 @@ async def test_devices(hass: HomeAssistant) -> None:
         assert state.state == STATE_ON
         assert state.name == "Garland #1"
         assert state.attributes["icon"] == "mdi:string-lights"
-        assert state.attributes["effect_list"] == EFFECT_LIST
+        assert list(state.attributes["effect_list"]) == EFFECT_LIST
         assert state.attributes["effect"] == "gradient"
         assert state.attributes["background_color"] == "black"
         assert state.attributes["modulation_effect"] == "sine"
@@ -202,7 +202,7 @@ async def test_devices(hass: HomeAssistant) -> None:
         assert state.state == STATE_OFF
         assert state.name == "Garland #2"
         assert state.attributes["icon"] == "mdi:string-lights"
-        assert state.attributes["effect_list"] == EFFECT_LIST
+        assert list(state.attributes["effect_list"]) == EFFECT_LIST
         assert state.attributes["attribution"] == ATTRIBUTION
 
         unique_id = _generate_id("ambi", updater.ip)
@@ -211,7 +211,7 @@ async def test_devices(hass: HomeAssistant) -> None:
         assert state.state == STATE_OFF
         assert state.name == "Ambilight"
         assert state.attributes["icon"] == "mdi:string-lights"
-        assert state.attributes["effect_list"] == EFFECT_LIST
+        assert list(state.attributes["effect_list"]) == EFFECT_LIST
         assert state.attributes["attribution"] == ATTRIBUTION
 
         async_fire_time_changed(
@@ -336,13 +336,23 @@ async def test_devices_on(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert device_code == "garland-2"
             assert effect == "bands(Reactive)"
 
             return json.loads(load_fixture("device_on_data.json"))
 
-        def error(device_code: str, effect: str, is_virtual: bool = False) -> None:
+        def error(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.device_on = AsyncMock(
@@ -423,13 +433,23 @@ async def test_devices_on_with_effect(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert device_code == "garland-2"
             assert effect == "wavelength(Reactive)"
 
             return json.loads(load_fixture("device_on_data.json"))
 
-        def error(device_code: str, effect: str, is_virtual: bool = False) -> None:
+        def error(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.device_on = AsyncMock(
@@ -510,9 +530,15 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert device_code == "garland-2"
             assert effect == "wavelength(Reactive)"
+            assert config == {"brightness": 0.5}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -520,36 +546,12 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert device_code == "garland-2"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": "black",
-                "blur": 3.0,
-                "brightness": 0.5,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -562,17 +564,26 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
 
         unique_id = _generate_id("garland_2", updater.ip)
 
-        await hass.services.async_call(
-            LIGHT_DOMAIN,
-            SERVICE_TURN_ON,
-            {
-                ATTR_ENTITY_ID: [unique_id],
-                ATTR_EFFECT: "wavelength(Reactive)",
-                ATTR_BRIGHTNESS: 125,
-            },
-            blocking=True,
-            limit=None,
-        )
+        with patch.object(
+            updater,
+            "async_update_device_listeners",
+            wraps=updater.async_update_device_listeners,
+        ) as mock_listeners:
+            await hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TURN_ON,
+                {
+                    ATTR_ENTITY_ID: [unique_id],
+                    ATTR_EFFECT: "wavelength(Reactive)",
+                    ATTR_BRIGHTNESS: 125,
+                },
+                blocking=True,
+                limit=None,
+            )
+
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+        mock_listeners.assert_called_once_with("garland-2")
 
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
@@ -853,6 +864,8 @@ async def test_devices_off(hass: HomeAssistant) -> None:
         state = hass.states.get(unique_id)
         assert state.state == STATE_OFF
 
+        assert not updater._device_refreshes
+
         with pytest.raises(LedFxRequestError):
             await hass.services.async_call(
                 LIGHT_DOMAIN,
@@ -26,6 +26,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTRIBUTION,
+    DEFAULT_DEVICE_REFRESH_DELAY,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -219,7 +220,7 @@ async def test_devices(hass: HomeAssistant) -> None:
         assert state.state == STATE_ON
         assert state.name == "WLED"
         assert state.attributes["icon"] == "mdi:led-strip-variant"
-        assert state.attributes["effect_list"] == EFFECT_LIST
+        assert list(state.attributes["effect_list"]) == EFFECT_LIST
         assert state.attributes["effect"] == "magnitude"
         assert state.attributes["attribution"] == ATTRIBUTION
 
@@ -229,7 +230,7 @@ async def test_devices(hass: HomeAssistant) -> None:
         assert state.state == STATE_OFF
         assert state.name == "WLED"
         assert state.attributes["icon"] == "mdi:led-strip-variant"
-        assert state.attributes["effect_list"] == EFFECT_LIST
+        assert list(state.attributes["effect_list"]) == EFFECT_LIST
         assert state.attributes["attribution"] == ATTRIBUTION
 
         async_fire_time_changed(
@@ -353,14 +354,24 @@ async def test_devices_on(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "bands"
 
             return json.loads(load_fixture("device_on_data.json"))
 
-        def error(device_code: str, effect: str, is_virtual: bool = False) -> None:
+        def error(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.device_on = AsyncMock(
@@ -437,14 +448,24 @@ async def test_devices_on_with_effect(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
 
             return json.loads(load_fixture("device_on_data.json"))
 
-        def error(device_code: str, effect: str, is_virtual: bool = False) -> None:
+        def error(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.device_on = AsyncMock(
@@ -521,10 +542,16 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
+            assert config == {"brightness": 0.5}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -532,37 +559,12 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert is_virtual
-            assert device_code == "wled-1"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": None,
-                "blur": 3.0,
-                "brightness": 0.5,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -587,6 +589,9 @@ async def test_devices_on_with_effect_and_brightness(hass: HomeAssistant) -> Non
             limit=None,
         )
 
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
         assert state.attributes["brightness"] == 125
@@ -616,10 +621,16 @@ async def test_devices_on_with_effect_and_rgbw(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
+            assert config == {"background_color": "#ea7d7e"}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -627,37 +638,12 @@ async def test_devices_on_with_effect_and_rgbw(hass: HomeAssistant) -> None:
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert is_virtual
-            assert device_code == "wled-1"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": "#ea7d7e",
-                "blur": 3.0,
-                "brightness": 0.0,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -682,6 +668,9 @@ async def test_devices_on_with_effect_and_rgbw(hass: HomeAssistant) -> None:
             limit=None,
         )
 
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
         assert state.attributes["effect"] == "wavelength(Reactive)"
@@ -710,10 +699,16 @@ async def test_devices_on_with_effect_and_rgbw_white(hass: HomeAssistant) -> Non
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
+            assert config == {"background_color": "#ffffff"}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -721,37 +716,12 @@ async def test_devices_on_with_effect_and_rgbw_white(hass: HomeAssistant) -> Non
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert is_virtual
-            assert device_code == "wled-1"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": "#ffffff",
-                "blur": 3.0,
-                "brightness": 0.0,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -776,6 +746,9 @@ async def test_devices_on_with_effect_and_rgbw_white(hass: HomeAssistant) -> Non
             limit=None,
         )
 
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
         assert state.attributes["effect"] == "wavelength(Reactive)"
@@ -804,10 +777,16 @@ async def test_devices_on_with_effect_and_rgbw_white_two(hass: HomeAssistant) ->
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
+            assert config == {"background_color": "#ffffff"}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -815,37 +794,12 @@ async def test_devices_on_with_effect_and_rgbw_white_two(hass: HomeAssistant) ->
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert is_virtual
-            assert device_code == "wled-1"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": "#ffffff",
-                "blur": 3.0,
-                "brightness": 0.0,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -870,6 +824,9 @@ async def test_devices_on_with_effect_and_rgbw_white_two(hass: HomeAssistant) ->
             limit=None,
         )
 
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
         assert state.attributes["effect"] == "wavelength(Reactive)"
@@ -898,10 +855,16 @@ async def test_devices_on_with_effect_and_rgbw_black(hass: HomeAssistant) -> Non
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success(device_code: str, effect: str, is_virtual: bool = False) -> dict:
+        def success(
+            device_code: str,
+            effect: str,
+            is_virtual: bool = False,
+            config: dict | None = None,
+        ) -> dict:
             assert is_virtual
             assert device_code == "wled-1"
             assert effect == "wavelength(Reactive)"
+            assert config == {"background_color": "#000000"}
 
             return json.loads(load_fixture("device_on_data.json"))
 
@@ -909,37 +872,12 @@ async def test_devices_on_with_effect_and_rgbw_black(hass: HomeAssistant) -> Non
             side_effect=MultipleSideEffect(success, success)
         )
 
-        def success_effect(
-            device_code: str, effect: str, config: dict, is_virtual: bool = False
-        ) -> dict:
-            assert is_virtual
-            assert device_code == "wled-1"
-            assert effect == "wavelength(Reactive)"
-            assert config == {
-                "active": True,
-                "background_color": "#000000",
-                "blur": 3.0,
-                "brightness": 0.0,
-                "flip": False,
-                "gradient_name": "Rainbow",
-                "gradient_repeat": 1,
-                "gradient_roll": 0,
-                "isProcessing": False,
-                "mirror": False,
-                "name": "Wavelength",
-                "type": "wavelength(Reactive)",
-            }
-
-            return json.loads(load_fixture("effect_data.json"))
-
         def error_effect(
             device_code: str, effect: str, config: dict, is_virtual: bool = False
         ) -> None:
             raise LedFxRequestError
 
-        mock_client.return_value.effect = AsyncMock(
-            side_effect=MultipleSideEffect(success_effect, error_effect)
-        )
+        mock_client.return_value.effect = AsyncMock(side_effect=error_effect)
 
         _, config_entry = await async_setup(hass)
 
@@ -964,6 +902,9 @@ async def test_devices_on_with_effect_and_rgbw_black(hass: HomeAssistant) -> Non
             limit=None,
         )
 
+        assert mock_client.return_value.device_on.call_count == 1
+        assert not mock_client.return_value.effect.called
+
         state = hass.states.get(unique_id)
         assert state.state == STATE_ON
         assert state.attributes["effect"] == "wavelength(Reactive)"
@@ -1230,6 +1171,62 @@ async def test_devices_off(hass: HomeAssistant) -> None:
             )
 
 
+@pytest.mark.asyncio
+async def test_devices_off_confirmed(hass: HomeAssistant) -> None:
+    """Test devices off confirmed by a device refresh.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        mock_client.return_value.device_off = AsyncMock(
+            return_value=json.loads(load_fixture("device_off_data.json"))
+        )
+        mock_client.return_value.virtual = AsyncMock(
+            return_value=json.loads(load_fixture("virtual_data.json"))
+        )
+
+        _, config_entry = await async_setup(hass)
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LedFxUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+
+        assert updater.last_update_success
+
+        unique_id = _generate_id("wled", updater.ip)
+
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_OFF,
+            {
+                ATTR_ENTITY_ID: [unique_id],
+            },
+            blocking=True,
+            limit=None,
+        )
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_OFF
+
+        devices = mock_client.return_value.devices.call_count
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_DEVICE_REFRESH_DELAY + 0.5)
+        )
+        await hass.async_block_till_done()
+
+        mock_client.return_value.virtual.assert_called_once_with("wled")
+        assert mock_client.return_value.devices.call_count == devices
+
+        state = hass.states.get(unique_id)
+        assert state.state == STATE_ON
+        assert state.attributes["effect"] == "magnitude"
+
+
 def _generate_id(code: str, ip_address: str) -> str:
     """Generate unique id
 
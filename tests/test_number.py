@@ -25,6 +25,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -150,6 +151,58 @@ async def test_effect_property(hass: HomeAssistant) -> None:
             )
 
 
+@pytest.mark.asyncio
+async def test_effect_property_schema_changed(hass: HomeAssistant) -> None:
+    """Test effect property effects follow the schema.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        _, config_entry = await async_setup(hass)
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LedFxUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        registry = er.async_get(hass)
+
+        assert updater.last_update_success
+
+        unique_id: str = _generate_id("wled_blur", updater.ip)
+
+        registry.async_update_entity(entity_id=unique_id, disabled_by=None)
+        await hass.async_block_till_done()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+        )
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+        )
+        await hass.async_block_till_done()
+
+        state: State = hass.states.get(unique_id)
+        assert "fade" in state.attributes["effects"]
+
+        schema: dict = json.loads(load_fixture("schema_data.json"))
+        del schema["effects"]["fade"]["schema"]["properties"]["blur"]
+
+        mock_client.return_value.schema = AsyncMock(return_value=schema)
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get(unique_id)
+        assert "fade" not in state.attributes["effects"]
+        assert "gradient" in state.attributes["effects"]
+
+
 @pytest.mark.asyncio
 async def test_new_effect_property(hass: HomeAssistant) -> None:
     """Test new effect property.
@@ -160,10 +213,10 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("schema_data.json"))
 
-        def success_two() -> dict:
+        def success_two(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("schema_changed_data.json"))
 
         mock_client.return_value.schema = AsyncMock(
@@ -195,7 +248,7 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
         assert registry.async_get(unique_id) is None
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
@@ -226,12 +279,12 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
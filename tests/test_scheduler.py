@@ -0,0 +1,136 @@
+"""Tests for the ledfx component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from custom_components.ledfx.const import (
+    STATISTIC_MAX_WAITING,
+    STATISTIC_REQUESTS,
+    STATISTIC_WAITING,
+)
+from custom_components.ledfx.enum import RequestPriority
+from custom_components.ledfx.scheduler import LedFxRequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priority() -> None:
+    """scheduler priority test"""
+
+    scheduler: LedFxRequestScheduler = LedFxRequestScheduler(1)
+    order: list[RequestPriority] = []
+    release: asyncio.Event = asyncio.Event()
+
+    async def blocker() -> None:
+        async with scheduler.slot(RequestPriority.STATE):
+            await release.wait()
+
+    async def request(priority: RequestPriority) -> None:
+        async with scheduler.slot(priority):
+            order.append(priority)
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(blocker())]
+    await asyncio.sleep(0)
+
+    for priority in (
+        RequestPriority.CATALOG,
+        RequestPriority.STATE,
+        RequestPriority.CATALOG,
+        RequestPriority.INTERACTIVE,
+    ):
+        tasks.append(asyncio.create_task(request(priority)))
+
+    await asyncio.sleep(0)
+
+    assert scheduler.statistics["catalog"][STATISTIC_WAITING] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == [
+        RequestPriority.INTERACTIVE,
+        RequestPriority.STATE,
+        RequestPriority.CATALOG,
+        RequestPriority.CATALOG,
+    ]
+    assert scheduler.statistics["catalog"][STATISTIC_WAITING] == 0
+    assert scheduler.statistics["catalog"][STATISTIC_MAX_WAITING] == 2
+    assert scheduler.statistics["catalog"][STATISTIC_REQUESTS] == 2
+    assert scheduler.statistics["state"][STATISTIC_REQUESTS] == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_defer_catalog() -> None:
+    """scheduler defers catalog requests test"""
+
+    scheduler: LedFxRequestScheduler = LedFxRequestScheduler(2)
+    release: asyncio.Event = asyncio.Event()
+    started: list[RequestPriority] = []
+
+    async def request(priority: RequestPriority) -> None:
+        async with scheduler.slot(priority):
+            started.append(priority)
+
+            if priority == RequestPriority.INTERACTIVE:
+                await release.wait()
+
+    interactive: asyncio.Task = asyncio.create_task(
+        request(RequestPriority.INTERACTIVE)
+    )
+    await asyncio.sleep(0)
+
+    catalog: asyncio.Task = asyncio.create_task(request(RequestPriority.CATALOG))
+    await asyncio.sleep(0)
+
+    assert started == [RequestPriority.INTERACTIVE]
+
+    await request(RequestPriority.STATE)
+
+    assert started == [RequestPriority.INTERACTIVE, RequestPriority.STATE]
+
+    release.set()
+    await asyncio.gather(interactive, catalog)
+
+    assert started[-1] == RequestPriority.CATALOG
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancel() -> None:
+    """scheduler cancelled waiter test"""
+
+    scheduler: LedFxRequestScheduler = LedFxRequestScheduler(1)
+    release: asyncio.Event = asyncio.Event()
+
+    async def blocker() -> None:
+        async with scheduler.slot(RequestPriority.STATE):
+            await release.wait()
+
+    async def request() -> None:
+        async with scheduler.slot(RequestPriority.INTERACTIVE):
+            pass
+
+    task: asyncio.Task = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+
+    waiter: asyncio.Task = asyncio.create_task(request())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    await task
+
+    await asyncio.wait_for(request(), 1)
+
+    assert scheduler.statistics["interactive"][STATISTIC_WAITING] == 0
+    assert scheduler.statistics["interactive"][STATISTIC_REQUESTS] == 1
@@ -31,6 +31,7 @@ from pytest_homeassistant_custom_component.common import (
 from custom_components.ledfx.const import (
     ATTR_SELECT_AUDIO_INPUT_NAME,
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -102,7 +103,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
     ):
         await async_mock_client(mock_client)
 
-        def error() -> None:
+        def error(skip_unchanged: bool = False) -> None:
             raise LedFxRequestError
 
         def original_device() -> dict:
@@ -117,10 +118,10 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
             )
         )
 
-        def original_config() -> dict:
+        def original_config(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_data.json"))
 
-        def changed_config() -> dict:
+        def changed_config(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_change_data.json"))
 
         mock_client.return_value.config = AsyncMock(
@@ -147,7 +148,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -176,7 +177,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         assert entry.entity_category == EntityCategory.CONFIG
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -213,7 +214,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         assert state.state == "samplerate"
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -370,10 +371,10 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("schema_data.json"))
 
-        def success_two() -> dict:
+        def success_two(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("schema_changed_data.json"))
 
         mock_client.return_value.schema = AsyncMock(
@@ -405,7 +406,7 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
         assert registry.async_get(unique_id) is None
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
@@ -436,12 +437,12 @@ async def test_new_effect_property(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
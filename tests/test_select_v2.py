@@ -25,7 +25,9 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTR_SELECT_AUDIO_INPUT_NAME,
+    ATTR_STATE,
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -80,6 +82,40 @@ async def test_init(hass: HomeAssistant) -> None:
         ]
 
 
+@pytest.mark.asyncio
+async def test_audio_devices_stale_schema(hass: HomeAssistant) -> None:
+    """Test audio devices unavailable with a stale schema.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client, patch(
+        "custom_components.ledfx.updater.async_dispatcher_send"
+    ):
+        await async_mock_client_2(mock_client)
+
+        _, config_entry = await async_setup(hass)
+
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        updater: LedFxUpdater = hass.data[DOMAIN][config_entry.entry_id][UPDATER]
+        unique_id: str = _generate_id(ATTR_SELECT_AUDIO_INPUT_NAME, updater.ip)
+
+        assert hass.states.get(unique_id).state == "ALSA: KT USB Audio: - (hw:1,0)"
+
+        mock_client.return_value.schema = AsyncMock(side_effect=LedFxRequestError)
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert updater.data[ATTR_STATE]
+        assert "schema" in updater.stale
+        assert hass.states.get(unique_id).state == STATE_UNAVAILABLE
+
+
 @pytest.mark.asyncio
 async def test_update_audio_devices(hass: HomeAssistant) -> None:
     """Test update audio_devices.
@@ -92,13 +128,13 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
     ):
         await async_mock_client_2(mock_client)
 
-        def error() -> None:
+        def error(skip_unchanged: bool = False) -> None:
             raise LedFxRequestError
 
-        def original_config() -> dict:
+        def original_config(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_v2_data.json"))
 
-        def changed_config() -> dict:
+        def changed_config(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_v2_change_data.json"))
 
         mock_client.return_value.config = AsyncMock(
@@ -127,7 +163,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -151,7 +187,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         assert entry.entity_category == EntityCategory.CONFIG
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -187,7 +223,7 @@ async def test_update_audio_devices(hass: HomeAssistant) -> None:
         assert state.state == "ALSA: pulse"
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -22,6 +22,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -51,10 +52,10 @@ async def test_update_device_sensors(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_data.json"))
 
-        def error() -> None:
+        def error(skip_unchanged: bool = False) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.config = AsyncMock(
@@ -101,12 +102,12 @@ async def test_update_device_sensors(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
@@ -129,12 +130,12 @@ async def test_update_device_sensors(hass: HomeAssistant) -> None:
         assert state.attributes["attribution"] == ATTRIBUTION
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -158,10 +159,10 @@ async def test_update_new_sensors(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_data.json"))
 
-        def success_two() -> dict:
+        def success_two(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_change_data.json"))
 
         mock_client.return_value.config = AsyncMock(
@@ -22,6 +22,7 @@ from pytest_homeassistant_custom_component.common import (
 
 from custom_components.ledfx.const import (
     ATTRIBUTION,
+    DEFAULT_CATALOG_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     UPDATER,
@@ -51,10 +52,10 @@ async def test_update_device_sensors_v2(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_v2_data.json"))
 
-        def error() -> None:
+        def error(skip_unchanged: bool = False) -> None:
             raise LedFxRequestError
 
         mock_client.return_value.config = AsyncMock(
@@ -92,12 +93,12 @@ async def test_update_device_sensors_v2(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 30)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 30)
         )
         await hass.async_block_till_done()
 
@@ -114,12 +115,12 @@ async def test_update_device_sensors_v2(hass: HomeAssistant) -> None:
         assert state.attributes["attribution"] == ATTRIBUTION
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+            hass, utcnow() + timedelta(seconds=DEFAULT_CATALOG_INTERVAL + 1)
         )
         await hass.async_block_till_done()
 
@@ -140,10 +141,10 @@ async def test_update_new_sensors_v2(hass: HomeAssistant) -> None:
     with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
         await async_mock_client_2(mock_client)
 
-        def success() -> dict:
+        def success(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_v2_data.json"))
 
-        def success_two() -> dict:
+        def success_two(skip_unchanged: bool = False) -> dict:
             return json.loads(load_fixture("config_v2_change_data.json"))
 
         mock_client.return_value.config = AsyncMock(
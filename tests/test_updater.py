@@ -4,17 +4,59 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from unittest.mock import AsyncMock, patch
+import os
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
-from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import load_fixture
-
-from custom_components.ledfx.const import ATTR_SELECT_AUDIO_INPUT, DOMAIN, UPDATER
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.dt import utcnow
+from httpx import Request, Response
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    load_fixture,
+)
+from pytest_httpx import HTTPXMock
+
+from custom_components.ledfx.client import json_dumps
+from custom_components.ledfx.const import (
+    ATTR_FIELD_EFFECTS,
+    ATTR_LIGHT_CUSTOM_PRESETS,
+    ATTR_LIGHT_EFFECTS,
+    ATTR_SELECT_AUDIO_INPUT,
+    ATTR_STATE,
+    ATTR_UPDATE_INTERVAL,
+    DEFAULT_IDLE_BACKOFF,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_UNREACHABLE_BACKOFF,
+    DEFAULT_WEBSOCKET_SCAN_INTERVAL,
+    DOMAIN,
+    STATISTIC_COALESCED_REFRESHES,
+    STATISTIC_LISTENER_CALLS,
+    STATISTIC_OVERRUNS,
+    STATISTIC_REFRESHES,
+    STATISTIC_SKIPPED_LISTENER_CALLS,
+    STORAGE_SAVE_DELAY,
+    UPDATER,
+)
+from custom_components.ledfx.exceptions import (
+    LedFxConnectionError,
+    LedFxNotModified,
+)
 from custom_components.ledfx.updater import LedFxUpdater, async_get_updater
-from tests.setup import async_mock_client, async_setup
+from tests.setup import (
+    MOCK_IP_ADDRESS,
+    MOCK_PORT,
+    async_mock_client,
+    async_mock_client_2,
+    async_setup,
+    get_url,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +85,835 @@ async def test_updater_schedule(hass: HomeAssistant) -> None:
     assert updater._unsub_refresh is not None
 
 
+@pytest.mark.asyncio
+async def test_updater_stop(hass: HomeAssistant) -> None:
+    """Test updater stop.
+
+    :param hass: HomeAssistant
+    """
+
+    updater, _ = await async_setup(hass)
+
+    assert not updater._http_client.is_closed
+
+    await updater.async_stop()
+
+    assert updater._http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_updater_prepare_order(hass: HomeAssistant) -> None:
+    """Test updater prepare order.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        events: list[str] = []
+
+        def track(method: str) -> AsyncMock:
+            response: dict = getattr(mock_client.return_value, method).return_value
+
+            async def side_effect(*args, **kwargs) -> dict:
+                events.append(f"{method}_start")
+                await asyncio.sleep(0)
+                events.append(f"{method}_end")
+
+                return response
+
+            return AsyncMock(side_effect=side_effect)
+
+        for method in (
+            "config",
+            "info",
+            "schema",
+            "devices",
+            "audio_devices",
+            "scenes",
+        ):
+            setattr(mock_client.return_value, method, track(method))
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert updater.data[ATTR_STATE]
+        assert events.index("scenes_start") < events.index("config_end")
+        assert events.index("info_start") > events.index("config_end")
+        assert events.index("schema_start") > events.index("config_end")
+        assert events.index("devices_start") > events.index("schema_end")
+        assert events.index("audio_devices_start") > events.index("schema_end")
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_refresh_deadline(hass: HomeAssistant) -> None:
+    """Test updater refresh deadline.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client, patch(
+        "custom_components.ledfx.updater.DEFAULT_REFRESH_DEADLINE", 0.05
+    ):
+        await async_mock_client(mock_client)
+
+        async def slow_schema(*args, **kwargs) -> dict:
+            await asyncio.sleep(1)
+
+            return {}  # pragma: no cover
+
+        mock_client.return_value.schema = AsyncMock(side_effect=slow_schema)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert updater.data[ATTR_STATE]
+        assert updater.overruns == {"schema": 1}
+        assert updater.stale == {"schema", "devices", "audio_devices"}
+        assert not updater.is_available("devices")
+        assert updater.is_available("scenes")
+        assert mock_client.return_value.devices.call_count == 0
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_deadline_keeps_hash(
+    hass: HomeAssistant, httpx_mock: HTTPXMock
+) -> None:
+    """Test a response received after the refresh deadline is parsed again.
+
+    :param hass: HomeAssistant
+    :param httpx_mock: HTTPXMock
+    """
+
+    fixtures: dict[str, str] = {
+        "config": "config_data.json",
+        "info": "info_data.json",
+        "schema": "schema_data.json",
+        "devices": "devices_data.json",
+        "audio/devices": "audio_devices_data.json",
+        "scenes": "scenes_data.json",
+    }
+    calls: dict[str, int] = {}
+
+    async def response(request: Request) -> Response:
+        path: str = request.url.path.removeprefix("/api/")
+        calls[path] = calls.get(path, 0) + 1
+
+        if path == "schema" and calls[path] == 1:
+            await asyncio.sleep(0.2)
+
+        return Response(200, text=load_fixture(fixtures[path]))
+
+    httpx_mock.add_callback(response)
+
+    with patch("custom_components.ledfx.updater.DEFAULT_REFRESH_DEADLINE", 0.1):
+        updater: LedFxUpdater = LedFxUpdater(hass, MOCK_IP_ADDRESS, MOCK_PORT)
+
+        await updater.update()
+
+        assert updater.overruns == {"schema": 1}
+        assert ATTR_LIGHT_EFFECTS not in updater.data
+
+        await asyncio.sleep(0.3)
+        await updater.update()
+
+    assert updater.stale == set()
+    assert ATTR_LIGHT_EFFECTS in updater.data
+    assert updater.effect_properties
+
+    await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_refresh_coalesced(hass: HomeAssistant) -> None:
+    """Test updater runs one refresh at a time.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        running: list[int] = [0, 0]
+        devices: dict = mock_client.return_value.devices.return_value
+
+        async def slow_devices(*args, **kwargs) -> dict:
+            running[0] += 1
+            running[1] = max(running)
+
+            await asyncio.sleep(0.05)
+
+            running[0] -= 1
+
+            return devices
+
+        mock_client.return_value.devices = AsyncMock(side_effect=slow_devices)
+
+        results: list[dict] = await asyncio.gather(
+            updater.update(), updater.update(), updater.update()
+        )
+
+        assert running[1] == 1
+        assert mock_client.return_value.devices.call_count == 2
+        assert all(result[ATTR_STATE] for result in results)
+        assert updater.refresh_statistics[STATISTIC_REFRESHES] == 3
+        assert updater.refresh_statistics[STATISTIC_COALESCED_REFRESHES] == 2
+        assert updater.refresh_statistics[STATISTIC_OVERRUNS] == 0
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_refresh_tiers(hass: HomeAssistant) -> None:
+    """Test updater refresh tiers.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert mock_client.return_value.schema.call_count == 1
+        assert mock_client.return_value.devices.call_count == 1
+
+        await updater.update()
+
+        assert mock_client.return_value.schema.call_count == 1
+        assert mock_client.return_value.config.call_count == 1
+        assert mock_client.return_value.scenes.call_count == 1
+        assert mock_client.return_value.devices.call_count == 2
+
+        updater._async_catalog_due(utcnow())
+        await updater.update()
+
+        assert mock_client.return_value.schema.call_count == 2
+        assert mock_client.return_value.config.call_count == 2
+        assert mock_client.return_value.scenes.call_count == 2
+        assert mock_client.return_value.devices.call_count == 3
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_not_modified(hass: HomeAssistant) -> None:
+    """Test updater not modified.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        effect_properties: dict = dict(updater.effect_properties)
+
+        assert effect_properties
+        mock_client.return_value.schema.assert_called_with(skip_unchanged=False)
+
+        mock_client.return_value.config = AsyncMock(side_effect=LedFxNotModified)
+        mock_client.return_value.colors = AsyncMock(side_effect=LedFxNotModified)
+        mock_client.return_value.schema = AsyncMock(side_effect=LedFxNotModified)
+
+        updater._async_catalog_due(utcnow())
+        await updater.update()
+
+        assert updater.last_update_success
+        assert updater.effect_properties == effect_properties
+        mock_client.return_value.schema.assert_called_once_with(skip_unchanged=True)
+
+        mock_client.return_value.colors = AsyncMock(
+            return_value=json.loads(load_fixture("colors_data.json"))
+        )
+
+        updater._async_catalog_due(utcnow())
+        await updater.update()
+
+        assert mock_client.return_value.schema.call_args.kwargs == {
+            "skip_unchanged": False
+        }
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_snapshot(hass: HomeAssistant, hass_storage: dict) -> None:
+    """Test updater snapshot.
+
+    :param hass: HomeAssistant
+    :param hass_storage: dict
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        updater: LedFxUpdater = LedFxUpdater(
+            hass, MOCK_IP_ADDRESS, MOCK_PORT, entry_id="test"
+        )
+
+        assert not await updater.async_restore()
+
+        await updater.update()
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert hass_storage[f"{DOMAIN}.test"]["data"]["schema"] == json.loads(
+            load_fixture("schema_data.json")
+        )
+
+        await updater.async_stop()
+
+        restored: LedFxUpdater = LedFxUpdater(
+            hass, MOCK_IP_ADDRESS, MOCK_PORT, entry_id="test"
+        )
+
+        assert await restored.async_restore()
+        assert restored.devices.keys() == updater.devices.keys()
+        assert restored.numbers.keys() == updater.numbers.keys()
+        assert restored.effect_properties.keys() == updater.effect_properties.keys()
+        assert not restored.data[ATTR_STATE]
+        assert mock_client.return_value.schema.call_count == 1
+
+        await restored.async_stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fixtures",
+    [
+        {
+            "config": "config_data.json",
+            "info": "info_data.json",
+            "schema": "schema_data.json",
+            "devices": "devices_data.json",
+            "audio/devices": "audio_devices_data.json",
+            "scenes": "scenes_data.json",
+        },
+        {
+            "config": "config_v2_data.json",
+            "colors": "colors_data.json",
+            "schema": "schema_v2_data.json",
+            "devices": "devices_v2_data.json",
+            "virtuals": "virtuals_data.json",
+            "scenes": "scenes_v2_data.json",
+        },
+    ],
+)
+async def test_updater_json_backends(
+    hass: HomeAssistant, httpx_mock: HTTPXMock, fixtures: dict[str, str]
+) -> None:
+    """Test updater data is the same with both json backends.
+
+    :param hass: HomeAssistant
+    :param httpx_mock: HTTPXMock
+    :param fixtures: dict[str, str]
+    """
+
+    for path, fixture in fixtures.items():
+        httpx_mock.add_response(url=get_url(path), text=load_fixture(fixture))
+
+    results: list[dict] = []
+
+    for loads, dumps in ((orjson.loads, orjson.dumps), (json.loads, json_dumps)):
+        with patch("custom_components.ledfx.client.JSON_LOADS", loads), patch(
+            "custom_components.ledfx.client.JSON_DUMPS", dumps
+        ):
+            updater: LedFxUpdater = LedFxUpdater(hass, MOCK_IP_ADDRESS, MOCK_PORT)
+
+        await updater.update()
+        await updater.async_stop()
+
+        assert updater.data[ATTR_STATE]
+
+        results.append(updater.data)
+
+    assert results[0] == results[1]
+
+    for fixture in os.listdir(os.path.join(os.path.dirname(__file__), "fixtures")):
+        content: str = load_fixture(fixture)
+
+        assert orjson.loads(content) == json.loads(content)
+        assert json.loads(orjson.dumps(json.loads(content))) == json.loads(
+            json_dumps(json.loads(content))
+        )
+
+
+@pytest.mark.asyncio
+async def test_updater_write_effect(hass: HomeAssistant) -> None:
+    """Test updater write effect.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        mock_client.return_value.effect = AsyncMock(return_value={})
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        await asyncio.gather(
+            updater.async_write_effect(
+                "wled", "gradient", {"blur": 1.0}, {"blur": 2.0}
+            ),
+            updater.async_write_effect("wled", "gradient", {"blur": 1.0}, {"speed": 3}),
+            updater.async_write_effect(
+                "wled", "gradient", {"blur": 1.0}, {"blur": 4.0}
+            ),
+        )
+
+        mock_client.return_value.effect.assert_called_once_with(
+            "wled", "gradient", {"blur": 4.0, "speed": 3}, False
+        )
+        assert updater.device_states["wled"].effect_config == {"blur": 4.0, "speed": 3}
+
+        mock_client.return_value.effect.reset_mock()
+
+        sent: asyncio.Event = asyncio.Event()
+
+        async def slow_effect(
+            device_code: str, effect: str, config: dict, is_virtual: bool = False
+        ) -> dict:
+            if config == {"blur": 5.0}:
+                sent.set()
+                await asyncio.sleep(10)
+
+            return {}
+
+        mock_client.return_value.effect.side_effect = slow_effect
+
+        first: asyncio.Task = hass.async_create_task(
+            updater.async_write_effect("wled", "gradient", {}, {"blur": 5.0})
+        )
+        await sent.wait()
+
+        await updater.async_write_effect("wled", "gradient", {}, {"blur": 6.0})
+        await first
+
+        assert mock_client.return_value.effect.call_count == 2
+        mock_client.return_value.effect.assert_called_with(
+            "wled", "gradient", {"blur": 6.0}, False
+        )
+        assert updater.device_states["wled"].effect_config == {"blur": 6.0}
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_write_effect_after_send(hass: HomeAssistant) -> None:
+    """Test updater write effect queued before the sent callback.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        mock_client.return_value.effect = AsyncMock(return_value={})
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        writes: list[asyncio.Task] = []
+
+        @callback
+        def write_again() -> None:
+            if not writes:
+                writes.append(
+                    hass.async_create_task(
+                        updater.async_write_effect(
+                            "wled", "gradient", {}, {"blur": 2.0}
+                        )
+                    )
+                )
+
+        remove_listener = updater.async_add_listener(write_again, "wled")
+
+        await updater.async_write_effect("wled", "gradient", {}, {"blur": 1.0})
+        await writes[0]
+
+        remove_listener()
+
+        assert mock_client.return_value.effect.call_count == 2
+        mock_client.return_value.effect.assert_called_with(
+            "wled", "gradient", {"blur": 2.0}, False
+        )
+        assert updater.device_states["wled"].effect_config == {"blur": 2.0}
+        assert "wled" not in updater._effect_writes
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_write_effect_untouched_colors(hass: HomeAssistant) -> None:
+    """Test updater write effect converts untouched colors.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        mock_client.return_value.effect = AsyncMock(return_value={})
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        config: dict = updater.device_states["wled"].effect_config | {
+            "color_lows": "black"
+        }
+
+        assert config["gradient"] == "Rainbow"
+
+        await updater.async_write_effect("wled", "gradient", config, {"speed": 3.0})
+
+        sent: dict = mock_client.return_value.effect.call_args.args[2]
+
+        assert sent["color_lows"] == updater.colors["black"]
+        assert sent["gradient"] == updater.gradients["Rainbow"]
+        assert sent["speed"] == 3.0
+        assert updater.device_states["wled"].effect_config["color_lows"] == "black"
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_websocket_event(hass: HomeAssistant) -> None:
+    """Test updater websocket event.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert updater.device_states["wled"].state
+        assert mock_client.return_value.devices.call_count == 1
+
+        updater._async_websocket_event(
+            {"type": "event", "event_type": "effect_cleared", "virtual_id": "wled"}
+        )
+
+        assert not updater.device_states["wled"].state
+        assert updater.device_states["wled"].brightness == 0
+
+        updater._async_websocket_event(
+            {
+                "type": "event",
+                "event_type": "effect_set",
+                "virtual_id": "wled",
+                "effect_id": "energy(Reactive)",
+                "effect_config": {"brightness": 0.5, "blur": 2.0},
+            }
+        )
+
+        assert updater.device_states["wled"].state
+        assert updater.device_states["wled"].effect == "energy(Reactive)"
+        assert updater.device_states["wled"].effect_config == {
+            "brightness": 0.5,
+            "blur": 2.0,
+        }
+
+        updater._async_websocket_connection(True)
+
+        assert updater.update_interval == timedelta(
+            seconds=DEFAULT_WEBSOCKET_SCAN_INTERVAL
+        )
+
+        updater._async_websocket_connection(False)
+
+        assert updater.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        await hass.async_block_till_done()
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_change_set(hass: HomeAssistant) -> None:
+    """Test updater notifies only the listeners of changed devices.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        calls: list[str | None] = []
+        removes: list = [
+            updater.async_add_listener(
+                lambda context=context: calls.append(context), context
+            )
+            for context in ("wled", "wled-1", None)
+        ]
+
+        updater.async_update_listeners()
+
+        assert calls == ["wled", "wled-1", None]
+
+        virtuals: dict = json.loads(load_fixture("virtuals_data.json"))
+        virtuals["virtuals"]["wled"]["effect"] = {}
+
+        mock_client.return_value.virtuals = AsyncMock(return_value=virtuals)
+
+        calls.clear()
+
+        await updater.update()
+        updater.async_update_listeners()
+
+        assert calls == ["wled"]
+        assert updater.refresh_statistics[STATISTIC_LISTENER_CALLS] == 4
+        assert updater.refresh_statistics[STATISTIC_SKIPPED_LISTENER_CALLS] == 2
+
+        calls.clear()
+
+        await updater.update()
+        updater.async_update_listeners()
+
+        assert calls == [None]
+        assert updater.data[ATTR_UPDATE_INTERVAL] == round(
+            DEFAULT_SCAN_INTERVAL * DEFAULT_IDLE_BACKOFF, 1
+        )
+
+        for remove in removes:
+            remove()
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_color_index(hass: HomeAssistant) -> None:
+    """Test updater color name index.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert updater.color_names["#ff0000"] == "red"
+        assert updater.color_names["#ff2800"] == "orange-deep"
+        assert updater.gradient_names[updater.gradients["Rainbow"]] == "Rainbow"
+
+        assert updater._convert_effect_config(
+            {
+                "color_lows": "#ff0000",
+                "gradient": updater.gradients["Dancefloor"],
+                "blur": 2.0,
+            }
+        ) == {"color_lows": "red", "gradient": "Dancefloor", "blur": 2.0}
+
+        assert updater._convert_config(
+            {"color_lows": "red", "gradient": "Rainbow", "blur": 2.0},
+            {"color_lows": "red"},
+        ) == {
+            "color_lows": "#ff0000",
+            "gradient": updater.gradients["Rainbow"],
+            "blur": 2.0,
+        }
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_effect_index(hass: HomeAssistant) -> None:
+    """Test updater effect index is built once per schema hash.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        mock_client.return_value.content_hash = MagicMock(return_value="first")
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        index = updater.effect_index
+
+        assert index.supports("bands", "band_count")
+        assert not index.supports("bands", "brightness")
+        assert not index.supports("bands", "background_color")
+        assert not index.supports(None, "band_count")
+        assert index.effects["band_count"] == ("bands", "bands_matrix")
+        assert (
+            updater.effect_properties["band_count"][ATTR_FIELD_EFFECTS]
+            is index.effects["band_count"]
+        )
+
+        updater._async_catalog_due(utcnow())
+        await updater.update()
+
+        assert updater.effect_index is index
+
+        mock_client.return_value.content_hash = MagicMock(return_value="second")
+
+        updater._async_catalog_due(utcnow())
+        await updater.update()
+
+        assert updater.effect_index is not index
+        assert updater.effect_index == index
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_effect_list(hass: HomeAssistant) -> None:
+    """Test updater effect list is shared until presets change.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        effect_list = updater.effect_list
+
+        assert isinstance(effect_list, tuple)
+        assert "bands" in effect_list
+        assert updater.effect_list is effect_list
+
+        await updater.update()
+
+        assert updater.effect_list is effect_list
+
+        updater.data[ATTR_LIGHT_CUSTOM_PRESETS] = updater.data[
+            ATTR_LIGHT_CUSTOM_PRESETS
+        ] | {"bands": ["test-preset"]}
+
+        assert updater.effect_list is not effect_list
+        assert "bands - test-preset" in updater.effect_list
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_adaptive_interval(hass: HomeAssistant) -> None:
+    """Test updater adaptive interval.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client(mock_client)
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+
+        assert updater.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        await updater.update()
+
+        assert updater.update_interval == timedelta(
+            seconds=DEFAULT_SCAN_INTERVAL * DEFAULT_IDLE_BACKOFF
+        )
+
+        for _ in range(10):
+            await updater.update()
+
+        assert updater.update_interval == timedelta(seconds=DEFAULT_MAX_SCAN_INTERVAL)
+        assert updater.data[ATTR_UPDATE_INTERVAL] == DEFAULT_MAX_SCAN_INTERVAL
+
+        updater.async_mark_active()
+
+        assert updater.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        await updater.update()
+
+        assert updater.update_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        mock_client.return_value.devices = AsyncMock(side_effect=LedFxConnectionError)
+
+        await updater.update()
+
+        assert not updater.data[ATTR_STATE]
+        assert updater.update_interval == timedelta(
+            seconds=DEFAULT_SCAN_INTERVAL * DEFAULT_UNREACHABLE_BACKOFF
+        )
+
+        await updater.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_updater_adaptive_interval_v2(hass: HomeAssistant) -> None:
+    """Test updater adaptive interval with fresh responses of every poll.
+
+    :param hass: HomeAssistant
+    """
+
+    with patch("custom_components.ledfx.updater.LedFxClient") as mock_client:
+        await async_mock_client_2(mock_client)
+
+        for method, fixture in (
+            ("config", "config_v2_data.json"),
+            ("colors", "colors_data.json"),
+            ("schema", "schema_v2_data.json"),
+            ("scenes", "scenes_data.json"),
+            ("devices", "devices_v2_data.json"),
+            ("virtuals", "virtuals_data.json"),
+        ):
+            getattr(
+                mock_client.return_value, method
+            ).side_effect = lambda *args, _fixture=fixture, **kwargs: json.loads(
+                load_fixture(_fixture)
+            )
+
+        updater, _ = await async_setup(hass)
+
+        await updater.update()
+        await updater.update()
+
+        assert updater._changed_responses == set()
+        assert updater.update_interval == timedelta(
+            seconds=DEFAULT_SCAN_INTERVAL * DEFAULT_IDLE_BACKOFF
+        )
+
+        await updater.async_stop()
+
+
 @pytest.mark.asyncio
 async def test_updater_incorrect_effect_field(hass: HomeAssistant) -> None:
     """Test updater incorrect effect field.
@@ -0,0 +1,129 @@
+"""Tests for the ledfx component."""
+
+# pylint: disable=no-member,too-many-statements,protected-access,too-many-lines
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.ledfx.enum import WebsocketEvent
+from custom_components.ledfx.websocket import LedFxWebsocket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_websocket(hass: HomeAssistant, socket_enabled) -> None:
+    """websocket test"""
+
+    subscriptions: list[dict] = []
+
+    async def websocket(request: web.Request) -> web.WebSocketResponse:
+        response: web.WebSocketResponse = web.WebSocketResponse()
+        await response.prepare(request)
+
+        for _ in WebsocketEvent:
+            subscriptions.append(await response.receive_json())
+
+        await response.send_json(
+            {
+                "id": 1,
+                "type": "event",
+                "event_type": WebsocketEvent.EFFECT_CLEARED.value,
+                "virtual_id": "wled",
+            }
+        )
+        await response.close()
+
+        return response
+
+    app: web.Application = web.Application()
+    app.router.add_get("/api/websocket", websocket)
+
+    events: list[dict] = []
+    connections: list[bool] = []
+    received: asyncio.Event = asyncio.Event()
+
+    def on_event(event: dict) -> None:
+        events.append(event)
+
+        if len(events) == 2:
+            received.set()
+
+    async with TestServer(app, host="127.0.0.1") as server:
+        client: LedFxWebsocket = LedFxWebsocket(
+            async_get_clientsession(hass, False),
+            server.host,
+            str(server.port),
+            on_event,
+            connections.append,
+        )
+
+        with patch("custom_components.ledfx.websocket.DEFAULT_WEBSOCKET_BACKOFF", 0):
+            client.start()
+
+            await asyncio.wait_for(received.wait(), 10)
+
+        await client.async_stop()
+
+    assert [subscription["event_type"] for subscription in subscriptions][:4] == [
+        event.value for event in WebsocketEvent
+    ]
+    assert events[0]["virtual_id"] == "wled"
+    assert client.reconnects >= 1
+    assert connections[:2] == [True, False]
+    assert not client.is_connected
+
+
+@pytest.mark.asyncio
+async def test_websocket_backoff(hass: HomeAssistant, socket_enabled) -> None:
+    """websocket backoff grows while connections close right away test"""
+
+    connects: list[float] = []
+    received: asyncio.Event = asyncio.Event()
+
+    async def websocket(request: web.Request) -> web.WebSocketResponse:
+        connects.append(time.monotonic())
+
+        if len(connects) == 5:
+            received.set()
+
+        response: web.WebSocketResponse = web.WebSocketResponse()
+        await response.prepare(request)
+
+        for _ in WebsocketEvent:
+            await response.receive_json()
+
+        await response.close()
+
+        return response
+
+    app: web.Application = web.Application()
+    app.router.add_get("/api/websocket", websocket)
+
+    async with TestServer(app, host="127.0.0.1") as server:
+        client: LedFxWebsocket = LedFxWebsocket(
+            async_get_clientsession(hass, False),
+            server.host,
+            str(server.port),
+            lambda event: None,
+            lambda is_connected: None,
+        )
+
+        with patch("custom_components.ledfx.websocket.DEFAULT_WEBSOCKET_BACKOFF", 0.02):
+            client.start()
+
+            await asyncio.wait_for(received.wait(), 10)
+
+        await client.async_stop()
+
+    assert connects[4] - connects[3] >= 0.16